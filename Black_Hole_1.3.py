@@ -1,9 +1,9 @@
 import os
 import math
 import time
-import zstandard as zstd
 from pathlib import Path
 from qiskit import QuantumCircuit
+from bh_zstd import copy_compressed, decompressor_for, final_compressor
 
 # Function to reverse chunks of data and save
 def reverse_and_save(input_filename, reversed_filename, chunk_size):
@@ -19,10 +19,9 @@ def reverse_and_save(input_filename, reversed_filename, chunk_size):
 # Function to compress the reversed file using zstd
 def compress_reversed(reversed_filename, compressed_filename):
     try:
-        with open(reversed_filename, 'rb') as infile:
-            compressed_data = zstd.compress(infile.read())  # Compress entire reversed file
-            with open(compressed_filename, 'wb') as outfile:
-                outfile.write(compressed_data)
+        with open(reversed_filename, 'rb') as infile, open(compressed_filename, 'wb') as outfile:
+            # Stream the reversed file through the shared compressor
+            copy_compressed(b"", infile, os.path.getsize(reversed_filename), outfile, final_compressor(b"", reversed_filename))
         return os.path.getsize(compressed_filename)
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -34,7 +33,7 @@ def decompress_and_restore(compressed_filename, restored_filename, chunk_size):
         with open(compressed_filename, 'rb') as infile:
             compressed_data = infile.read()
 
-        decompressed_data = zstd.decompress(compressed_data)  # Decompress the data
+        decompressed_data = decompressor_for(compressed_data).decompress(compressed_data)  # Decompress the data
 
         # Reverse again in chunks to restore the original order
         restored_data = b"".join([decompressed_data[i:i+chunk_size][::-1] 
@@ -4,6 +4,7 @@ import zstandard as zstd
 from pathlib import Path
 import math
 from qiskit import QuantumCircuit
+from bh_zstd import copy_compressed, decompressor_for, final_compressor
 
 # Function to reverse data in chunks
 def reverse_and_save(input_filename, reversed_filename, chunk_size):
@@ -11,24 +12,28 @@ def reverse_and_save(input_filename, reversed_filename, chunk_size):
         while chunk := infile.read(chunk_size):
             outfile.write(chunk[::-1])  # Reverse each chunk before writing
 
+# Function to reverse every chunk of an in-memory buffer through memoryview slices
+def reverse_in_memory(view, chunk_size):
+    reversed_data = bytearray(len(view))
+    for i in range(0, len(view), chunk_size):
+        reversed_data[i:i + chunk_size] = view[i:i + chunk_size][::-1]
+    return reversed_data
+
 # Function to compress and embed chunk size
 def compress_reversed(reversed_filename, compressed_filename, chunk_size):
-    with open(reversed_filename, 'rb') as infile:
-        reversed_data = infile.read()
-    
     # Embed the chunk size at the beginning (4 bytes, big-endian)
     chunk_size_bytes = chunk_size.to_bytes(4, 'big')
-    compressed_data = zstd.compress(chunk_size_bytes + reversed_data)
 
-    with open(compressed_filename, 'wb') as outfile:
-        outfile.write(compressed_data)
+    # Stream the chunk size and the file through the shared compressor
+    with open(reversed_filename, 'rb') as infile, open(compressed_filename, 'wb') as outfile:
+        copy_compressed(chunk_size_bytes, infile, os.path.getsize(reversed_filename), outfile, final_compressor(chunk_size_bytes, reversed_filename))
 
 # Function to decompress and restore the original file
 def decompress_and_restore(compressed_filename, restored_filename):
     with open(compressed_filename, 'rb') as infile:
         compressed_data = infile.read()
 
-    decompressed_data = zstd.decompress(compressed_data)
+    decompressed_data = decompressor_for(compressed_data).decompress(compressed_data)
     
     # Extract the first 4 bytes to get the chunk size
     chunk_size = int.from_bytes(decompressed_data[:4], 'big')
@@ -44,29 +49,26 @@ def decompress_and_restore(compressed_filename, restored_filename):
 
 # Function to determine the best chunk size
 def find_best_chunk_size(input_filename):
-    file_size = os.path.getsize(input_filename)
+    # Read the input once; every candidate is reversed and compressed in memory
+    with open(input_filename, 'rb') as infile:
+        data = infile.read()
+    view = memoryview(data)
+    file_size = len(data)
+    search_cctx = zstd.ZstdCompressor()  # Reused for every candidate
     best_chunk_size = 1
     best_compression_ratio = float('inf')
 
     print(f"📏 Checking best chunk size from 1 to {file_size} bytes...")
 
     for chunk_size in range(1, file_size + 1):
-        reversed_file = input_filename + ".rev"
-        compressed_file = f"compress.{Path(input_filename).name}.b"
-        
-        reverse_and_save(input_filename, reversed_file, chunk_size)
-        compress_reversed(reversed_file, compressed_file, chunk_size)
-
-        compressed_size = os.path.getsize(compressed_file)
+        reversed_data = reverse_in_memory(view, chunk_size)
+        compressed_size = len(search_cctx.compress(chunk_size.to_bytes(4, 'big') + reversed_data))
         compression_ratio = compressed_size / file_size
 
         if compression_ratio < best_compression_ratio:
             best_compression_ratio = compression_ratio
             best_chunk_size = chunk_size
 
-        os.remove(reversed_file)
-        os.remove(compressed_file)
-
     print(f"✅ Best chunk size: {best_chunk_size} bytes (Compression Ratio: {best_compression_ratio:.4f})")
     return best_chunk_size
 
@@ -4,6 +4,7 @@ import zstandard as zstd  # Importing Zstd for compression
 from pathlib import Path
 import struct
 from qiskit import QuantumCircuit
+from bh_zstd import copy_compressed, decompressor_for, final_compressor
 
 # Function to run a quantum computation (without Aer, transpile, or execute)
 def quantum_computation_example():
@@ -40,18 +41,12 @@ def reverse_and_save(input_filename, reversed_filename, chunk_size, num_chunks):
 
 # Function to compress and save metadata (chunk size + num_chunks) with Zstd
 def compress_reversed_with_zstd(reversed_filename, compressed_filename, chunk_size, num_chunks):
-    with open(reversed_filename, 'rb') as infile:
-        reversed_data = infile.read()
-
     # Store metadata (num_chunks) in the first 2 bytes
     metadata = struct.pack(">H", num_chunks)  # Store num_chunks as a 10-bit value in 2 bytes
 
-    # Compress data using Zstd
-    cctx = zstd.ZstdCompressor()
-    compressed_data = cctx.compress(metadata + reversed_data)
-
-    with open(compressed_filename, 'wb') as outfile:
-        outfile.write(compressed_data)
+    # Stream the metadata and the file through the shared compressor
+    with open(reversed_filename, 'rb') as infile, open(compressed_filename, 'wb') as outfile:
+        copy_compressed(metadata, infile, os.path.getsize(reversed_filename), outfile, final_compressor(metadata, reversed_filename))
 
 # Function to decompress and restore the original file with Zstd
 def decompress_and_restore_with_zstd(compressed_filename, restored_filename):
@@ -59,8 +54,7 @@ def decompress_and_restore_with_zstd(compressed_filename, restored_filename):
         compressed_data = infile.read()
 
     # Decompress the data using Zstd
-    dctx = zstd.ZstdDecompressor()
-    decompressed_data = dctx.decompress(compressed_data)
+    decompressed_data = decompressor_for(compressed_data).decompress(compressed_data)
 
     # Read metadata (first 2 bytes for num_chunks)
     num_chunks = struct.unpack(">H", decompressed_data[:2])[0] & 0x03FF  # Mask 10 bits
@@ -80,7 +74,12 @@ def decompress_and_restore_with_zstd(compressed_filename, restored_filename):
 
 # Function to determine the best chunk size and number of reversed chunks
 def find_best_parameters(input_filename):
-    file_size = os.path.getsize(input_filename)
+    # Read the input once; every candidate is reversed and compressed in memory
+    with open(input_filename, 'rb') as infile:
+        data = infile.read()
+    view = memoryview(data)
+    file_size = len(data)
+    search_cctx = zstd.ZstdCompressor()  # Reused for every candidate
     best_chunk_size = 1
     best_num_chunks = 1
     best_compression_ratio = float('inf')
@@ -88,14 +87,14 @@ def find_best_parameters(input_filename):
     print(f"📏 Finding the best parameters (chunk size and reversed chunks)...")
 
     for chunk_size in range(1, file_size + 1):
+        # Reversing the first `num_chunks` chunks extends the previous candidate by one chunk,
+        # so only that chunk is reversed in place on each step
+        reversed_data = bytearray(data)
         for num_chunks in range(1, file_size // chunk_size + 1):
-            reversed_file = input_filename + ".rev"
-            compressed_file = f"compress.{Path(input_filename).name}.b"
-
-            reverse_and_save(input_filename, reversed_file, chunk_size, num_chunks)
-            compress_reversed_with_zstd(reversed_file, compressed_file, chunk_size, num_chunks)
+            start = (num_chunks - 1) * chunk_size
+            reversed_data[start:start + chunk_size] = view[start:start + chunk_size][::-1]
 
-            compressed_size = os.path.getsize(compressed_file)
+            compressed_size = len(search_cctx.compress(struct.pack(">H", num_chunks) + reversed_data))
             compression_ratio = compressed_size / file_size
 
             if compression_ratio < best_compression_ratio:
@@ -103,9 +102,6 @@ def find_best_parameters(input_filename):
                 best_chunk_size = chunk_size
                 best_num_chunks = num_chunks
 
-            os.remove(reversed_file)
-            os.remove(compressed_file)
-
     print(f"✅ Best chunk size: {best_chunk_size}, best reversed chunks: {best_num_chunks} (Compression Ratio: {best_compression_ratio:.4f})")
     return best_chunk_size, best_num_chunks
 
@@ -4,6 +4,7 @@ import random
 import struct
 from pathlib import Path
 from qiskit import QuantumCircuit
+from bh_zstd import copy_compressed, decompressor_for, final_compressor
 
 # Reverse chunks at specified indices starting from the first byte
 def reverse_chunks_at_positions(input_filename, reversed_filename, chunk_size, positions):
@@ -25,23 +26,33 @@ def reverse_chunks_at_positions(input_filename, reversed_filename, chunk_size, p
     with open(reversed_filename, 'wb') as outfile:
         outfile.write(b"".join(chunked_data))
 
-# Compress using Zstd with metadata
-def compress_with_zstd(reversed_filename, compressed_filename, chunk_size, positions, original_size):
-    with open(reversed_filename, 'rb') as infile:
-        reversed_data = infile.read()
-
+# Pack the original size, chunk size and positions stored in front of the data
+def pack_metadata(chunk_size, positions, original_size):
     # Pack the chunk size, positions, and original file size into the metadata
     metadata = struct.pack(">Q", original_size)  # Store original file size (8 bytes)
     metadata += struct.pack(">H", chunk_size)  # Store chunk size (2 bytes)
     metadata += struct.pack(f">H", len(positions))  # Store number of positions (2 bytes)
     metadata += struct.pack(f">{len(positions)}H", *positions)  # Store positions
+    return metadata
 
-    # Compress the file with the metadata
-    cctx = zstd.ZstdCompressor()
-    compressed_data = cctx.compress(metadata + reversed_data)
+# Reverse chunks at specified indices of an in-memory copy, padded like reverse_chunks_at_positions
+def reverse_chunks_in_memory(data, chunk_size, positions):
+    reversed_data = bytearray(data)
+    if len(reversed_data) % chunk_size:
+        reversed_data += b'\x00' * (chunk_size - len(reversed_data) % chunk_size)
+    for pos in positions:
+        start = pos * chunk_size
+        if 0 <= start < len(reversed_data):
+            reversed_data[start:start + chunk_size] = reversed_data[start:start + chunk_size][::-1]
+    return reversed_data
+
+# Compress using Zstd with metadata
+def compress_with_zstd(reversed_filename, compressed_filename, chunk_size, positions, original_size):
+    metadata = pack_metadata(chunk_size, positions, original_size)
 
-    with open(compressed_filename, 'wb') as outfile:
-        outfile.write(compressed_data)
+    # Stream the metadata and the file through the shared compressor
+    with open(reversed_filename, 'rb') as infile, open(compressed_filename, 'wb') as outfile:
+        copy_compressed(metadata, infile, os.path.getsize(reversed_filename), outfile, final_compressor(metadata, reversed_filename))
 
 # Decompression and restoration
 def decompress_and_restore(compressed_filename, restored_filename):
@@ -49,8 +60,7 @@ def decompress_and_restore(compressed_filename, restored_filename):
         compressed_data = infile.read()
 
     # Decompress the data
-    dctx = zstd.ZstdDecompressor()
-    decompressed_data = dctx.decompress(compressed_data)
+    decompressed_data = decompressor_for(compressed_data).decompress(compressed_data)
 
     # Extract metadata
     original_size = struct.unpack(">Q", decompressed_data[:8])[0]  # First 8 bytes for original file size
@@ -79,7 +89,11 @@ def decompress_and_restore(compressed_filename, restored_filename):
 
 # Find best chunking strategy based on file size
 def find_best_chunk_strategy(input_filename):
-    file_size = os.path.getsize(input_filename)
+    # Read the input once; every candidate is reversed and compressed in memory
+    with open(input_filename, 'rb') as infile:
+        data = infile.read()
+    file_size = len(data)
+    search_cctx = zstd.ZstdCompressor()  # Reused for every candidate
     best_chunk_size = 1
     best_positions = []
     best_compression_ratio = float('inf')
@@ -95,13 +109,8 @@ def find_best_chunk_strategy(input_filename):
             positions_count = random.randint(1, min(max_positions, 64))  # Limit to max positions or 64
             positions = random.sample(range(max_positions), positions_count)
 
-            reversed_file = input_filename + ".rev"
-            compressed_file = f"compress.{Path(input_filename).name}.b"
-
-            reverse_chunks_at_positions(input_filename, reversed_file, chunk_size, positions)
-            compress_with_zstd(reversed_file, compressed_file, chunk_size, positions, file_size)
-
-            compressed_size = os.path.getsize(compressed_file)
+            reversed_data = reverse_chunks_in_memory(data, chunk_size, positions)
+            compressed_size = len(search_cctx.compress(pack_metadata(chunk_size, positions, file_size) + reversed_data))
             compression_ratio = compressed_size / file_size
 
             if compression_ratio < best_compression_ratio:
@@ -109,9 +118,6 @@ def find_best_chunk_strategy(input_filename):
                 best_chunk_size = chunk_size
                 best_positions = positions
 
-            os.remove(reversed_file)
-            os.remove(compressed_file)
-
     print(f"✅ Best chunk size: {best_chunk_size}, Best positions: {best_positions} (Compression Ratio: {best_compression_ratio:.4f})")
 
     # Calculate qubits (2^(chunks+1))
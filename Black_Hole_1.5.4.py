@@ -1,29 +1,21 @@
 import os
+import io
+import time
 import random
 import struct
 from pathlib import Path
-import zstandard as zstd
 from qiskit import QuantumCircuit
-
-# Reverse chunks at specified indices starting from the first byte
-def reverse_chunks_at_positions(input_filename, reversed_filename, chunk_size, positions):
-    with open(input_filename, 'rb') as infile:
-        data = infile.read()
-
-    # Ensure the chunking starts from byte 1
-    chunked_data = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
-
-    # Add padding to the last chunk if it's less than the specified chunk size
-    if len(chunked_data[-1]) < chunk_size:
-        chunked_data[-1] = chunked_data[-1] + b'\x00' * (chunk_size - len(chunked_data[-1]))
-
-    # Reverse chunks at the specified positions, starting from the first chunk
-    for pos in positions:
-        if 0 <= pos < len(chunked_data):  # Ensure position is within bounds
-            chunked_data[pos] = chunked_data[pos][::-1]
-
-    with open(reversed_filename, 'wb') as outfile:
-        outfile.write(b"".join(chunked_data))
+from bh_zstd import (ZSTD_SEARCH_SETTINGS, cctx, copy_compressed, decompressor_for, load_dictionary,
+                     looks_like_text, make_zstd_contexts, search_cctx)
+
+# (level, threads, long distance matching, window log) settings compared by the benchmark
+ZSTD_BENCHMARK_SETTINGS = [
+    (3, 0, False, None),
+    (3, -1, False, None),
+    (3, -1, True, 27),
+    (9, -1, True, 27),
+    (19, -1, True, 27),
+]
 
 # Function to generate a random number (simulating quantum-like randomness)
 def generate_random_number(num_bits=28):
@@ -31,11 +23,8 @@ def generate_random_number(num_bits=28):
     random_number = random.getrandbits(num_bits)  # Generate random number with 'num_bits' bits
     return random_number % (2**28)  # Ensure the number fits within 28 bits
 
-# Compress using zstd with metadata
-def compress_with_zstd(reversed_filename, compressed_filename, chunk_size, positions, original_size):
-    with open(reversed_filename, 'rb') as infile:
-        reversed_data = infile.read()
-
+# Pack the original size, chunk size and positions stored in front of the data
+def pack_metadata(chunk_size, positions, original_size):
     # Pack the chunk size (4 bytes), positions, and original file size (8 bytes) into the metadata
     metadata = struct.pack(">Q", original_size)  # Store original file size (8 bytes)
     metadata += struct.pack(">I", chunk_size)  # Store chunk size as 4 bytes (4 bytes)
@@ -47,29 +36,26 @@ def compress_with_zstd(reversed_filename, compressed_filename, chunk_size, posit
         if pos < 0 or pos >= 2**28:
             raise ValueError(f"Position {pos} is out of bounds for 28-bit encoding (should be 0 to 2^28-1).")
         metadata += struct.pack(">I", pos)  # Pack each position as a 32-bit integer (will mask later)
+    return metadata
 
-    # Create a compressor
-    cctx = zstd.ZstdCompressor()
-
-    # Compress the file with the metadata
-    compressed_data = cctx.compress(metadata + reversed_data)
-
-    with open(compressed_filename, 'wb') as outfile:
-        outfile.write(compressed_data)
-
-    # Print the path of the compressed file
-    print(f"✅ Compressed file saved at: {os.path.abspath(compressed_filename)}")
+# Reverse chunks at specified indices of an in-memory copy, zero-padded to whole chunks
+def reverse_chunks_in_memory(data, chunk_size, positions):
+    reversed_data = bytearray(data)
+    if len(reversed_data) % chunk_size:
+        reversed_data += b'\x00' * (chunk_size - len(reversed_data) % chunk_size)
+    for pos in positions:
+        start = pos * chunk_size
+        if 0 <= start < len(reversed_data):
+            reversed_data[start:start + chunk_size] = reversed_data[start:start + chunk_size][::-1]
+    return reversed_data
 
 # Decompression and restoration using zstd
 def decompress_and_restore_zstd(compressed_filename, restored_filename):
     with open(compressed_filename, 'rb') as infile:
         compressed_data = infile.read()
 
-    # Create a decompressor
-    dctx = zstd.ZstdDecompressor()
-
-    # Decompress the data
-    decompressed_data = dctx.decompress(compressed_data)
+    # Decompress the data, with the dictionary named in the frame header if any
+    decompressed_data = decompressor_for(compressed_data).decompress(compressed_data)
 
     # Extract metadata
     original_size = struct.unpack(">Q", decompressed_data[:8])[0]  # First 8 bytes for original file size
@@ -104,7 +90,20 @@ def extract_filename_with_extension(filename):
 
 # Find best chunking strategy based on file size
 def find_best_chunk_strategy(input_filename):
-    file_size = os.path.getsize(input_filename)
+    # Read the input once; every candidate is reversed and compressed in memory
+    with open(input_filename, 'rb') as infile:
+        data = infile.read()
+    file_size = len(data)
+
+    # Text inputs use the trained dictionary when it beats plain zstd on the whole file
+    candidate_cctx, final_cctx = search_cctx, cctx
+    if looks_like_text(data):
+        dictionary = load_dictionary()
+        dictionary_cctx = make_zstd_contexts(*ZSTD_SEARCH_SETTINGS, dict_data=dictionary)[0]
+        if len(dictionary_cctx.compress(data)) < len(search_cctx.compress(data)):
+            candidate_cctx, final_cctx = dictionary_cctx, make_zstd_contexts(dict_data=dictionary)[0]
+            print(f"📖 Using zstd dictionary {dictionary.dict_id()}")
+
     best_chunk_size = 1
     best_positions = []
     best_compression_ratio = float('inf')
@@ -120,17 +119,11 @@ def find_best_chunk_strategy(input_filename):
             positions_count = random.randint(1, min(max_positions, 64))  # Limit to max positions or 64
             positions = random.sample(range(max_positions), positions_count)
 
-            reversed_file = "reversed_file.bin"
-            reverse_chunks_at_positions(input_filename, reversed_file, chunk_size, positions)
-
-            # Compress the reversed file
-            compressed_file = "compressed_file.bin"
-            original_size = os.path.getsize(input_filename)
-            compress_with_zstd(reversed_file, compressed_file, chunk_size, positions, original_size)
+            reversed_data = reverse_chunks_in_memory(data, chunk_size, positions)
 
             # Calculate compression ratio
-            compressed_size = os.path.getsize(compressed_file)
-            compression_ratio = compressed_size / original_size
+            compressed_size = len(candidate_cctx.compress(pack_metadata(chunk_size, positions, file_size) + reversed_data))
+            compression_ratio = compressed_size / file_size
 
             # Track the best compression ratio
             if compression_ratio < best_compression_ratio:
@@ -140,11 +133,40 @@ def find_best_chunk_strategy(input_filename):
 
     print(f"✅ Best chunk size: {best_chunk_size}, Best positions: {best_positions} (Compression Ratio: {best_compression_ratio})")
 
+    # Only the winning candidate is written to disk
+    compressed_file = "compressed_file.bin"
+    reversed_data = reverse_chunks_in_memory(data, best_chunk_size, best_positions)
+    with open(compressed_file, 'wb') as outfile:
+        copy_compressed(pack_metadata(best_chunk_size, best_positions, file_size), io.BytesIO(reversed_data), len(reversed_data), outfile, final_cctx)
+    print(f"✅ Compressed file saved at: {os.path.abspath(compressed_file)}")
+
+# Compare compression speed and ratio of the zstd settings on sample files
+def benchmark_zstd(filenames, settings=ZSTD_BENCHMARK_SETTINGS):
+    samples = []
+    for filename in filenames:
+        with open(filename, 'rb') as infile:
+            samples.append((filename, infile.read()))
+
+    print(f"{'level':>5} {'threads':>7} {'ldm':>5} {'window':>6}  {'file':<24} {'ratio':>7} {'comp MB/s':>9} {'dec MB/s':>9}")
+    for level, threads, long_distance_matching, window_log in settings:
+        bench_cctx, bench_dctx = make_zstd_contexts(level, threads, long_distance_matching, window_log)
+        for filename, data in samples:
+            start = time.perf_counter()
+            compressed = bench_cctx.compress(data)
+            compress_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            bench_dctx.decompress(compressed)
+            decompress_seconds = time.perf_counter() - start
+            megabytes = len(data) / 1e6
+            print(f"{level:>5} {threads:>7} {str(long_distance_matching):>5} {str(window_log or '-'):>6}  "
+                  f"{Path(filename).name[:24]:<24} {len(compressed) / max(len(data), 1):>7.4f} "
+                  f"{megabytes / max(compress_seconds, 1e-9):>9.1f} {megabytes / max(decompress_seconds, 1e-9):>9.1f}")
+
 # Main function
 def main():
     print("Created by Jurijus Pacalovas.")
     
-    mode = int(input("Enter mode (1 for compress, 2 for extract): "))
+    mode = int(input("Enter mode (1 for compress, 2 for extract, 3 for zstd benchmark): "))
     
     if mode == 1:  # Compression
         input_filename = input("Enter input file name to compress: ")
@@ -155,5 +177,9 @@ def main():
         restored_filename = input("Enter restored file name: ")
         decompress_and_restore_zstd(compressed_filename, restored_filename)
 
+    elif mode == 3:  # Benchmark
+        filenames = input("Enter sample file names (comma separated): ")
+        benchmark_zstd([name.strip() for name in filenames.split(",") if name.strip()])
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -8,6 +8,12 @@ import math
 
 import os.path
 
+import sys
+
+# The search only needs the qubit count; pass --circuit to also build one
+# QuantumCircuit (requires qiskit) for the final count.
+BUILD_CIRCUIT = "--circuit" in sys.argv[1:]
+
 long_1=0
 
 name=""
@@ -41,6 +47,16 @@ class compression:
                         
                         # Find the position of the highest set bit
                         return number.bit_length() + 1      
+                def report_qubits(Universe):
+                        """
+                            Prints the qubit count the search ended on.  Only
+                            builds a QuantumCircuit when --circuit was given.
+                            """
+                        print("Qubits: "+str(Universe))
+                        if BUILD_CIRCUIT:
+                            from qiskit import QuantumCircuit
+                            circuit = QuantumCircuit(Universe)
+                            print("Circuit qubits: "+str(circuit.num_qubits))
 
 
 
@@ -52,15 +68,16 @@ class compression:
 
                           
 
-                def process_files(Number_of_the_file, Hole_Number_information, Add_Numbers, Multiply, counts):
+                def process_files(Number_of_the_file, Deep5, Add_Numbers, Multiply, counts):
 
                         Before_X = Number_of_the_file
 
-                        Square_of_ROOT = Hole_Number_information
+                        # Square_of_ROOT is 2**Deep5 - 1 (at least Key = 2**n - 1), so the
+                        # product below is a shift and a subtract rather than a multiply.
 
-                        if Square_of_ROOT<=Key:
+                        if Deep5<=Key.bit_length():
 
-                               Square_of_ROOT=Key
+                               Deep5=Key.bit_length()
                         if Number_of_the_file>=2**26*1024*1024:
                            Number_of_the_file=2**26*1024*1024
 
@@ -71,7 +88,7 @@ class compression:
                      
                         
 
-                        Number_of_the_file =((((Number_of_the_file * Square_of_ROOT) + Add_Numbers) // 3) * Multiply)
+                        Number_of_the_file =(((((Number_of_the_file << Deep5) - Number_of_the_file) + Add_Numbers) // 3) * Multiply)
 
                         F=0
 
@@ -93,7 +110,15 @@ class compression:
 
                 
 
-                        return Number_of_the_file, Square_of_ROOT, Add_Numbers, Multiply, counts
+                        return Number_of_the_file, Deep5, Add_Numbers, Multiply, counts
+
+                def same_as_file(Number_of_the_file):
+
+                        # int(INFO,2) is parsed once per file; the bit length
+                        # turns most candidates away before the full compare.
+                        if Number_of_the_file.bit_length()!=INFO_length:
+                            return False
+                        return Number_of_the_file==INFO_number
 
                 self.name = "Written: Jurijus pacalovas"
 
@@ -299,6 +324,10 @@ class compression:
 
                                     A=int(Extact,2)
 
+                                    INFO_number=A
+
+                                    INFO_length=A.bit_length()
+
                                
 
                                       
@@ -319,7 +348,6 @@ class compression:
 
 
 
-                                    from qiskit import QuantumCircuit
 
                                             
 
@@ -397,9 +425,7 @@ class compression:
 
                                             Universe=int(Universe)
                                             University=int(k2)
-                                            circuit = QuantumCircuit(Universe)
 
-                                            QuantumCircuit(University)
 
                                             
 
@@ -572,21 +598,17 @@ class compression:
 
                                                             Number_of_the_file=0
 
-                                                        if Deep5<=26*1024*1024:
+                                                        if Deep5>26*1024*1024:
 
-                                                                Hole_Number_information=(2**Deep5)-1
 
-                                                        else:
 
                                                                 Deep5=26*1024*1024
 
-                                                                Hole_Number_information=(2**Deep5)-1
 
                                                                 
 
-                                                        Square_of_ROOT=Hole_Number_information
 
-                                                        Number_of_the_file, Hole_Number_information, Add_Numbers, Multiply, counts = process_files(Number_of_the_file, Hole_Number_information, Add_Numbers, Multiply, counts)
+                                                        Number_of_the_file, Deep5, Add_Numbers, Multiply, counts = process_files(Number_of_the_file, Deep5, Add_Numbers, Multiply, counts)
 
 
 
@@ -616,13 +638,13 @@ class compression:
 
                                                         File_information6_Times2=0
 
-                                                        if int(INFO,2)==Number_of_the_file:  
+                                                        if same_as_file(Number_of_the_file):  
 
                                                                if C==1:
 
                                                                        C=1
 
-                                                if int(INFO,2)==Number_of_the_file and File_information6_Times2_1==Times_12:
+                                                if same_as_file(Number_of_the_file) and File_information6_Times2_1==Times_12:
 
                                                        long_1=len(File_information5_17)
 
@@ -658,7 +680,7 @@ class compression:
 
                                                        Counts=Time_Real4+Time_Real1+Time_Real3
 
-                                                       if int(INFO,2)==Number_of_the_file and File_information6_Times2_1==Times_12:
+                                                       if same_as_file(Number_of_the_file) and File_information6_Times2_1==Times_12:
 
                                                                File_information5_17="1"+XN+Counts+long_file
 
@@ -684,6 +706,8 @@ class compression:
 
                                     if Extract1==1:                
 
+                                            report_qubits(Universe)
+
                                             L=len(File_information5_17)
 
                                             n = int(File_information5_17, 2)
@@ -792,7 +816,6 @@ class compression:
 
                                                 
 
-                                    from qiskit import QuantumCircuit
 
                                             
 
@@ -865,10 +888,8 @@ class compression:
 
                                             Universe=int(Universe)
                                             University=int(k2)
-                                            circuit = QuantumCircuit(Universe)
                                             
 
-                                            QuantumCircuit(University)
 
                                             
 
@@ -1043,21 +1064,16 @@ class compression:
 
                                                             Number_of_the_file=0
 
-                                                        Hole_Number_information=(2**Deep5)-1
 
-                                                        Square_of_ROOT=Hole_Number_information
 
-                                                        if Deep5<=26*1024*1024:
+                                                        if Deep5>26*1024*1024:
 
-                                                                Hole_Number_information=(2**Deep5)-1
 
-                                                        else:
 
                                                                 Deep5=26*1024*1024
 
-                                                                Hole_Number_information=(2**Deep5)-1
 
-                                                        Number_of_the_file, Hole_Number_information, Add_Numbers, Multiply, counts = process_files(Number_of_the_file, Hole_Number_information, Add_Numbers, Multiply, counts)
+                                                        Number_of_the_file, Deep5, Add_Numbers, Multiply, counts = process_files(Number_of_the_file, Deep5, Add_Numbers, Multiply, counts)
 
 
 
@@ -1087,7 +1103,7 @@ class compression:
 
                                                         File_information6_Times2=0
 
-                                                        if int(INFO,2)==Number_of_the_file:  
+                                                        if same_as_file(Number_of_the_file):  
 
                                                                if C==1:
 
@@ -1107,6 +1123,8 @@ class compression:
 
                                     if Extract1==1:                
 
+                                            report_qubits(Universe)
+
                                             L=len(File_information5_17)
 
                                             n = int(File_information5_17, 2)
@@ -7,7 +7,91 @@ import binascii
 import math
 
 import os.path
- 
+
+import sys
+
+import hashlib
+import json
+
+# The search only needs the qubit count; pass --circuit to also build one
+# QuantumCircuit (requires qiskit) for the final count.
+BUILD_CIRCUIT = "--circuit" in sys.argv[1:]
+
+# Pass --resume to continue an interrupted compress search from its
+# name.state checkpoint, written every CHECKPOINT_SECONDS.
+RESUME = "--resume" in sys.argv[1:]
+
+CHECKPOINT_SECONDS = 60
+
+CURSOR_FIELDS = 12
+
+class SearchCheckpoint:
+
+        """
+            Cursor of the compress search kept in name+".state".  The search
+            is one chain (each trial starts from the last trial's number), so
+            the cursor holds the whole chain state, not just k2, and is only
+            loaded back for the input it was written for.
+            """
+
+        def __init__(self, name, INFO, interval=CHECKPOINT_SECONDS):
+
+                self.path = name + ".state"
+
+                self.input_digest = hashlib.blake2b(INFO.encode(), digest_size=16).hexdigest()
+
+                self.interval = interval
+
+                self.last = time()
+
+        def load(self):
+
+                if not os.path.exists(self.path):
+
+                        return None
+
+                with open(self.path) as f:
+
+                        state = json.load(f)
+
+                if state.get("input") != self.input_digest:
+
+                        print("Checkpoint "+self.path+" is for another file, starting over.")
+
+                        return None
+
+                if len(state["cursor"]) != CURSOR_FIELDS:
+
+                        print("Checkpoint "+self.path+" is from an older version, starting over.")
+
+                        return None
+
+                return state["cursor"]
+
+        def due(self):
+
+                return time() - self.last >= self.interval
+
+        def save(self, cursor):
+
+                state = {"input": self.input_digest, "cursor": cursor}
+
+                tmp = self.path + ".tmp"
+
+                with open(tmp, "w") as f:
+
+                        json.dump(state, f)
+
+                os.replace(tmp, self.path)
+
+                self.last = time()
+
+        def remove(self):
+
+                if os.path.exists(self.path):
+
+                        os.remove(self.path)
+
 long_1=0
 
 name=""
@@ -41,6 +125,16 @@ class compression:
                         
                         # Find the position of the highest set bit
                         return number.bit_length() + 1      
+                def report_qubits(Universe):
+                        """
+                            Prints the qubit count the search ended on.  Only
+                            builds a QuantumCircuit when --circuit was given.
+                            """
+                        print("Qubits: "+str(Universe))
+                        if BUILD_CIRCUIT:
+                            from qiskit import QuantumCircuit
+                            circuit = QuantumCircuit(Universe)
+                            print("Circuit qubits: "+str(circuit.num_qubits))
 
 
 
@@ -52,15 +146,16 @@ class compression:
 
                           
 
-                def process_files(Number_of_the_file, Hole_Number_information, Add_Numbers, Multiply, counts):
+                def process_files(Number_of_the_file, Deep5, Add_Numbers, Multiply, counts):
 
                         Before_X = Number_of_the_file
 
-                        Square_of_ROOT = Hole_Number_information
+                        # Square_of_ROOT is 2**Deep5 - 1 (at least Key = 2**n - 1), so the
+                        # product below is a shift and a subtract rather than a multiply.
 
-                        if Square_of_ROOT<=Key:
+                        if Deep5<=Key.bit_length():
 
-                               Square_of_ROOT=Key
+                               Deep5=Key.bit_length()
 
                               
 
@@ -71,7 +166,7 @@ class compression:
                                 
                         
 
-                        Number_of_the_file =((((Number_of_the_file * Square_of_ROOT) + Add_Numbers) // 3) * Multiply)
+                        Number_of_the_file =(((((Number_of_the_file << Deep5) - Number_of_the_file) + Add_Numbers) // 3) * Multiply)
                         #print(Number_of_the_file)
 
                         F=0
@@ -94,7 +189,15 @@ class compression:
 
                 
 
-                        return Number_of_the_file, Square_of_ROOT, Add_Numbers, Multiply, counts
+                        return Number_of_the_file, Deep5, Add_Numbers, Multiply, counts
+
+                def same_as_file(Number_of_the_file):
+
+                        # int(INFO,2) is parsed once per file; the bit length
+                        # turns most candidates away before the full compare.
+                        if Number_of_the_file.bit_length()!=INFO_length:
+                            return False
+                        return Number_of_the_file==INFO_number
 
                 self.name = "Written: Jurijus pacalovas"
 
@@ -301,6 +404,10 @@ class compression:
 
                                     A=int(Extact,2)
 
+                                    INFO_number=A
+
+                                    INFO_length=A.bit_length()
+
                                
 
                                       
@@ -321,7 +428,6 @@ class compression:
 
 
 
-                                    from qiskit import QuantumCircuit
 
                                             
 
@@ -373,8 +479,32 @@ class compression:
                                     num=0
                                     result=0
 
+                                    File_information6_Times2_1=0
+
+                                    # Set at the start of each chain; saved with the cursor so a resume mid-chain has them
+                                    Deep5=0
+                                    Times_half_Real=0
+                                    T=0
+                                    Add=0
+
+                                    checkpoint = SearchCheckpoint(name, INFO)
+
+                                    if RESUME:
+
+                                            cursor = checkpoint.load()
+
+                                            if cursor is not None:
+
+                                                    k1, k2, X1, counts, y, File_information6_Times2, File_information6_Times2_1, File_information5_2, Deep5, Times_half_Real, T, Add = cursor
+
+                                                    print("Resuming from k2="+str(k2+1))
+
                                     while Extract1!=1:
 
+                                            if checkpoint.due():
+
+                                                    checkpoint.save([k1, k2, X1, counts, y, File_information6_Times2, File_information6_Times2_1, File_information5_2, Deep5, Times_half_Real, T, Add])
+
                                             k1+=1
 
                                             k2+=1
@@ -399,9 +529,7 @@ class compression:
 
                                             Universe=int(Universe)
                                             University=int(k2)
-                                            circuit = QuantumCircuit(Universe)
 
-                                            QuantumCircuit(University)
 
                                             
 
@@ -439,42 +567,8 @@ class compression:
                                     
                                  
                                     
-                                            # Initialize variables
-                                            X4 = []  # Initialize an empty list X4
-                                          # Initialize counter X1
-                                            max_elements = 2**20 * 1024
-                                            user_input = "random"
-                                            if user_input.lower() == "random":
-                                                        # Generate a random number
-                                                        N4 = Number_of_the_file
-                                                        # Example range for random numbers
-                                                        #print(f"Random number generated: {N4}")
-                                                                                        
-                                            elif not user_input:
-                                                        print("Input cannot be empty. Please enter a valid number.")
-                                                        continue
-                                            else:
-                                                        # Convert input to integer
-                                                        N4 = int(user_input)
-                                                        #print(f"Number entered: {N4}")
-                                            
-                                                    # Reset condition (e.g., user enters 0 to reset)
-                                      
-                                                                                   # Check if N4 is in the list X4
-                                            if N4 in X4:
-                                                        pass  # Do nothing, X1 stays the same
-                                            else:
-                                                        X1 += 1  # Increment X1
-                                            
-                                                    # Add N4 to the list if the maximum size is not exceeded
-                                            if len(X4) < max_elements:
-                                                        X4.append(N4)
-                                            else:
-                                                        #print("Maximum list size reached! Resetting...")
-                                                        X4 = []  # Reset the list
-                                                         # Reset the counter
-                                            
-                                                    # Print the updated values of X1 and the size of X4
+                                            # X1 counts every trial; the count is written to the header
+                                            X1 += 1  # Increment X1
 
                                     
     
@@ -609,21 +703,17 @@ class compression:
 
                                                             Number_of_the_file=0
 
-                                                        if Deep5<=26*1024*1024:
+                                                        if Deep5>26*1024*1024:
 
-                                                                Hole_Number_information=(2**Deep5)-1
 
-                                                        else:
 
                                                                 Deep5=26*1024*1024
 
-                                                                Hole_Number_information=(2**Deep5)-1
 
                                                                 
 
-                                                        Square_of_ROOT=Hole_Number_information
 
-                                                        Number_of_the_file, Hole_Number_information, Add_Numbers, Multiply, counts = process_files(Number_of_the_file, Hole_Number_information, Add_Numbers, Multiply, counts)
+                                                        Number_of_the_file, Deep5, Add_Numbers, Multiply, counts = process_files(Number_of_the_file, Deep5, Add_Numbers, Multiply, counts)
 
 
 
@@ -653,13 +743,13 @@ class compression:
 
                                                         File_information6_Times2=0
 
-                                                        if int(INFO,2)==Number_of_the_file:  
+                                                        if same_as_file(Number_of_the_file):  
 
                                                                if C==1:
 
                                                                        C=1
 
-                                                if int(INFO,2)==Number_of_the_file and File_information6_Times2_1==Times_12:
+                                                if same_as_file(Number_of_the_file) and File_information6_Times2_1==Times_12:
 
                                                        long_1=len(File_information5_17)
 
@@ -695,7 +785,7 @@ class compression:
 
                                                        Counts=Time_Real4+Time_Real1+Time_Real3
 
-                                                       if int(INFO,2)==Number_of_the_file and File_information6_Times2_1==Times_12:
+                                                       if same_as_file(Number_of_the_file) and File_information6_Times2_1==Times_12:
 
                                                                File_information5_17="1"+XN+Counts+long_file
 
@@ -721,6 +811,10 @@ class compression:
 
                                     if Extract1==1:                
 
+                                            report_qubits(Universe)
+
+                                            checkpoint.remove()
+
                                             L=len(File_information5_17)
 
                                             n = int(File_information5_17, 2)
@@ -829,7 +923,6 @@ class compression:
 
                                                 
 
-                                    from qiskit import QuantumCircuit
 
                                             
 
@@ -902,10 +995,8 @@ class compression:
 
                                             Universe=int(Universe)
                                             University=int(k2)
-                                            circuit = QuantumCircuit(Universe)
                                             
 
-                                            QuantumCircuit(University)
 
                                             
 
@@ -943,42 +1034,8 @@ class compression:
                                          
 
                                    
-                                            # Initialize variables
-                                            X4 = []  # Initialize an empty list X4
-                                          # Initialize counter X1
-                                            max_elements = 2**20 * 1024
-                                            user_input = "random"
-                                            if user_input.lower() == "random":
-                                                        # Generate a random number
-                                                        N4 = Number_of_the_file
-                                                        # Example range for random numbers
-                                                        #print(f"Random number generated: {N4}")
-                                                                                        
-                                            elif not user_input:
-                                                        print("Input cannot be empty. Please enter a valid number.")
-                                                        continue
-                                            else:
-                                                        # Convert input to integer
-                                                        N4 = int(user_input)
-                                                        #print(f"Number entered: {N4}")
-                                            
-                                                    # Reset condition (e.g., user enters 0 to reset)
-                                      
-                                                                                   # Check if N4 is in the list X4
-                                            if N4 in X4:
-                                                        pass  # Do nothing, X1 stays the same
-                                            else:
-                                                        X1 += 1  # Increment X1
-                                            
-                                                    # Add N4 to the list if the maximum size is not exceeded
-                                            if len(X4) < max_elements:
-                                                        X4.append(N4)
-                                            else:
-                                                        #print("Maximum list size reached! Resetting...")
-                                                        X4 = []  # Reset the list
-                                                         # Reset the counter
-                                            
-                                                    # Print the updated values of X1 and the size of X4
+                                            # X1 counts every trial; the count is written to the header
+                                            X1 += 1  # Increment X1
 
                                             if Times_12 > 2**y:
 
@@ -1112,21 +1169,16 @@ class compression:
 
                                                             Number_of_the_file=0
 
-                                                        Hole_Number_information=(2**Deep5)-1
 
-                                                        Square_of_ROOT=Hole_Number_information
 
-                                                        if Deep5<=26*1024*1024:
+                                                        if Deep5>26*1024*1024:
 
-                                                                Hole_Number_information=(2**Deep5)-1
 
-                                                        else:
 
                                                                 Deep5=26*1024*1024
 
-                                                                Hole_Number_information=(2**Deep5)-1
 
-                                                        Number_of_the_file, Hole_Number_information, Add_Numbers, Multiply, counts = process_files(Number_of_the_file, Hole_Number_information, Add_Numbers, Multiply, counts)
+                                                        Number_of_the_file, Deep5, Add_Numbers, Multiply, counts = process_files(Number_of_the_file, Deep5, Add_Numbers, Multiply, counts)
 
 
 
@@ -1156,7 +1208,7 @@ class compression:
 
                                                         File_information6_Times2=0
 
-                                                        if int(INFO,2)==Number_of_the_file:  
+                                                        if same_as_file(Number_of_the_file):  
 
                                                                if C==1:
 
@@ -1176,6 +1228,8 @@ class compression:
 
                                     if Extract1==1:                
 
+                                            report_qubits(Universe)
+
                                             L=len(File_information5_17)
 
                                             n = int(File_information5_17, 2)
@@ -4,6 +4,9 @@ import binascii
 import math
 import os.path
 import sys
+import heapq
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 # @Author Jurijus Pacalovas
 
 # Get the name of the current script
@@ -14,6 +17,69 @@ if os.path.basename(sys.argv[0]) != 'Black_Hole_3.py':
 
 print("The script 'Black_Hole_3.py' is currently running.")
 
+class RunningMin:
+    # Running minimum of (size, key) pairs for search loops: the first key
+    # to reach the smallest size wins ties.  With top_k > 0 it also keeps
+    # the top_k smallest in a heap, worst on top.
+    __slots__ = ("key", "size", "top_k", "heap", "count")
+    def __init__(self, top_k=0):
+        self.key = None
+        self.size = None
+        self.top_k = top_k
+        self.heap = []
+        self.count = 0
+    def update(self, key, size):
+        if self.size is None or size < self.size:
+            self.key = key
+            self.size = size
+        if self.top_k > 0:
+            entry = (-size, -self.count, key)
+            self.count += 1
+            if len(self.heap) < self.top_k:
+                heapq.heappush(self.heap, entry)
+            elif entry > self.heap[0]:
+                heapq.heapreplace(self.heap, entry)
+    def best(self):
+        if self.size is None:
+            return None
+        return self.key, self.size
+    def smallest(self):
+        # The kept top_k as (key, size), smallest and earliest first.
+        return [(key, -size) for size, count, key in sorted(self.heap, reverse=True)]
+SWEEP_WORKERS = os.cpu_count() or 1
+SWEEP_BATCH = 64  # Consecutive En rounds per pool task
+SWEEP_MIN_BITS = 2**16  # Shorter INFO is swept in-process; a pool task costs more than its rounds
+sweep_INFO = ""
+def init_sweep_worker(INFO):
+    global sweep_INFO
+    sweep_INFO = INFO
+def En_field_length(En):
+    # Length of the En-field encoding of sweep_INFO, plus the width of C1
+    # if any field was written as "010"/"011" (0 otherwise).
+    long_F = len(sweep_INFO)
+    long_Space = En.bit_length()
+    bit_width = math.ceil(math.log2(En + 1))
+    long_TUPLE = 0
+    long_C1 = 0
+    block = 0
+    while block < long_F:
+        INFO_A = sweep_INFO[block : block + En]
+        longl = len(INFO_A)
+        C = format(int(INFO_A, 2), '01b')
+        C3 = En - len(C)
+        if (C3 > (long_Space + 3)) or INFO_A[:3] in {"011", "010"}:
+            long_C1 = bit_width
+            if C3 != 1:
+                long_TUPLE += 3 + bit_width + len(C)
+            else:
+                long_TUPLE += 3 + longl - 2
+        else:
+            long_TUPLE += longl
+        block += En
+    return long_TUPLE, long_C1
+
+def En_field_lengths(Ens):
+    return [En_field_length(En) for En in Ens]
 class compression:
     def cryptograpy_compression4(self):
 
@@ -53,19 +119,59 @@ class compression:
                 En = 255
             En+=1
             return En, Row1, Row
-        import re
-        def find_smallest_longl_F_values(input_string):
-            # Extract all 'En', 'En2', 'Row', and 'Longl_F' values
-            pattern = r'En=(\d+), Longl_F=(\d+)'
-            matches = re.findall(pattern, input_string)
-            # Convert the extracted strings to tuples of integers
-            longl_F_values = [(int(en), int(longl_f)) for en, longl_f in matches]
-            if longl_F_values:                
-                # Find the smallest 'Longl_F' value and its corresponding variables
-                smallest_longl_F_values = min(longl_F_values, key=lambda x: x[1])                
-                return smallest_longl_F_values                
+        def sweep_En(INFO, long_limit):
+            # Walks the En rounds exactly like the old serial search (Find/Row
+            # with Count_adds, earliest shortest wins) but takes each round's
+            # encoded length from En_field_length, run ahead in a process pool
+            # in batches of SWEEP_BATCH rounds when INFO is long enough.
+            # Returns the En to encode with and len(C1) before that pass.
+            Find = 0
+            En = 3
+            Row1 = 0
+            Row = 0
+            long_C1 = 0
+            best = RunningMin()
+            executor = None
+            trials = deque()
+            lengths = deque()
+            En_next = En
+            if SWEEP_WORKERS > 1 and len(INFO) >= SWEEP_MIN_BITS:
+                executor = ProcessPoolExecutor(
+                    max_workers=SWEEP_WORKERS,
+                    initializer=init_sweep_worker,
+                    initargs=(INFO,),
+                )
             else:
-                return None
+                init_sweep_worker(INFO)
+            try:
+                while Find != 2 and Row != (2**28) - 2:
+                    if executor is None:
+                        long_TUPLE, bit_width = En_field_length(En)
+                    else:
+                        if not lengths:
+                            while len(trials) < SWEEP_WORKERS * 4:
+                                Ens = []
+                                for _ in range(SWEEP_BATCH):
+                                    Ens.append(En_next)
+                                    En_next, _, _ = Count_adds(En_next, 0, 0)
+                                trials.append(executor.submit(En_field_lengths, Ens))
+                            lengths.extend(trials.popleft().result())
+                        long_TUPLE, bit_width = lengths.popleft()
+                    if bit_width != 0:
+                        long_C1 = bit_width
+                    if Row == (2**28) - 3 and Find == 3:
+                        En = best.key
+                        Find = 2
+                    elif long_TUPLE + long_C1 < long_limit and long_C1 != 0:
+                        best.update(En, long_TUPLE)
+                        Find = 3
+                        En, Row1, Row = Count_adds(En, Row1, Row)
+                    else:
+                        En, Row1, Row = Count_adds(En, Row1, Row)
+            finally:
+                if executor is not None:
+                    executor.shutdown(cancel_futures=True)
+            return En, long_C1
         self.name = "Written: Jurijus pacalovas"
         N5 = 1
         if N5 == 1:
@@ -214,21 +320,13 @@ class compression:
 
                                 Extract1 = 0
 
-                                Find = 0
-
                                 En = 3
 
                                 Ci = 1
 
                                 M1 = 0
 
-                                Row1 = 0
-
-                                input_string = ""
-
-                                C1 = ""
-
-                                Row = 0
+                                long_C1 = 0
 
                                 I8 = INFO
 
@@ -388,131 +486,119 @@ class compression:
 
 
 
-                                while Find != 1:
-
+                                En, long_C1 = sweep_En(INFO, long_11 * 8)
 
-
-                                    # print(Find)
+                                TUPLE = ""
 
 
 
-                                    TUPLE = ""
+                                N3 = 0
 
 
 
-                                    N3 = 0
-
+                                long_F = len(INFO)
 
 
-                                    long_F = len(INFO)
 
+                                block = 0
 
 
-                                    block = 0
 
+                                FC = 0
 
 
-                                    FC = 0
 
+                                IF1 = ""
 
 
-                                    IF1 = ""
 
+                                while block < long_F:
 
 
-                                    while block < long_F:
 
+                                    INFO_A = INFO[block : block + En]
 
 
-                                        INFO_A = INFO[block : block + En]
 
+                                    longl = len(INFO_A)
 
 
-                                        longl = len(INFO_A)
 
+                                    Counts = int(INFO_A, 2)
 
 
-                                        Counts = int(INFO_A, 2)
 
+                                    C = format(Counts, '01b')
 
 
-                                        C = format(Counts, '01b')
 
-
-
-                                        C3 = En - len(C)
-                                        
-                                        En_Space = format(En, '01b')
-                                        long_Space=len(En_Space)
+                                    C3 = En - len(C)
+                                    
+                                    En_Space = format(En, '01b')
+                                    long_Space=len(En_Space)
 
 
 
-                                        # print(C1)
+                                    # print(C1)
 
 
 
-                                        if (C3>(long_Space+3)) or INFO_A[:3] in {"011", "010"}:
+                                    if (C3>(long_Space+3)) or INFO_A[:3] in {"011", "010"}:
 
     
 
-                                            # print(C3)
-
-
-
-                                            Counts = int(INFO_A, 2)
+                                        # print(C3)
 
 
 
-                                            C = format(Counts, '01b')
-
-
+                                        Counts = int(INFO_A, 2)
 
-                                            C4 = En - len(C)
 
 
+                                        C = format(Counts, '01b')
 
-                                            bit_width = math.ceil(math.log2(En + 1))
 
 
+                                        C4 = En - len(C)
 
-                                            C1 = format(C4, f'0{bit_width}b')
 
 
+                                        bit_width = math.ceil(math.log2(En + 1))
 
-                                            C2 = format(longl, '06b')
 
 
+                                        C1 = format(C4, f'0{bit_width}b')
 
-                                            if C3 != 1:
+                                        long_C1 = len(C1)
 
 
 
-                                                Z5 = "011" + C1 + C
-                                                #print(len(C1))
+                                        C2 = format(longl, '06b')
 
 
 
-                                                # print(Z5)
+                                        if C3 != 1:
 
 
 
-                                            if C3 == 1:
+                                            Z5 = "011" + C1 + C
+                                            #print(len(C1))
 
 
 
-                                                Z5 = "010" + INFO_A[2:]
+                                            # print(Z5)
 
 
 
-                                                # print(Z5)
+                                        if C3 == 1:
 
 
 
-                                                # print(INFO_A)
+                                            Z5 = "010" + INFO_A[2:]
 
 
 
-                                            # print(C1)
+                                            # print(Z5)
 
 
 
@@ -520,171 +606,43 @@ class compression:
 
 
 
-                                        else:
-
-
-
-                                            Z5 = INFO_A
-
-
-
-                                            # not six Zeros_onesros else 7 Zeros_onesros or more left or 2-5 Zeros_onesros
-
-
-
-                                        # change back
-
-
-
-                                        # same siZeros_ones
-
-
-
-                                        TUPLE += Z5
-
-
-
-                                        # print(Find)
-
-
-
-                                        block += En
-
-
-
-                                    if Find == 2 or Row == (2**28) - 2:
-
-
-
-                                        Find = 1
-
-
-
-                                        Extract1 = 1
-
-
-
-                                    elif Row == (2**28) - 3 and Find == 3:
-
-
-
-                                        smallest_longl_F_values = (
-
-                                            find_smallest_longl_F_values(input_string)
-
-                                        )
-
-
-
-                                        if smallest_longl_F_values:
-
-
-
-                                            en, longl_F = smallest_longl_F_values
-
-
-
-                                            En = int(en)
-
-
-
-                                            Find = 2
-
-
-
-                                    elif (
-
-                                        len(TUPLE) +  len(C1) < long_11 * 8
-
-                                        and len(C1) != 0
-
-                                    ):
-
-
-
-                                        input_string += (
-
-                                            "En="
-
-                                            + str(En)
-
-                                            + ", "
-
-                                            + "Longl_F="
-
-                                            + str(len(TUPLE))
-
-                                            + " / "
-
-                                        )
-
-
-
-                                        if len(input_string) > 100:
-
-
-
-                                            smallest_longl_F_values = (
-
-                                                find_smallest_longl_F_values(
-
-                                                    input_string
-
-                                                )
-
-                                            )
-
-
-
-                                            if smallest_longl_F_values:
-
-
-
-                                                en, longl_F = smallest_longl_F_values
-
+                                        # print(C1)
 
 
-                                                input_string = (
 
-                                                    "En="
+                                        # print(INFO_A)
 
-                                                    + str(en)
 
-                                                    + ", "
 
-                                                    + "Longl_F="
+                                    else:
 
-                                                    + str(longl_F)
 
-                                                    + " / "
 
-                                                )
+                                        Z5 = INFO_A
 
 
 
-                                                # print(input_string)
+                                        # not six Zeros_onesros else 7 Zeros_onesros or more left or 2-5 Zeros_onesros
 
 
 
-                                        Find = 3
+                                    # change back
 
 
 
-                                        En, Row1, Row = Count_adds(En, Row1, Row)
+                                    # same siZeros_ones
 
 
 
-                                        # print(En)
+                                    TUPLE += Z5
 
 
 
-                                        # print(len(TUPLE))
-
+                                    # print(Find)
 
 
-                                    else:
 
-                                            En, Row1, Row = Count_adds(En, Row1, Row)
+                                    block += En
 
 
 
@@ -696,7 +654,7 @@ class compression:
 
 
 
-                                    W = "0" + str(len(C1)) + "b"
+                                    W = "0" + str(long_C1) + "b"
 
 
 
@@ -2753,6 +2711,7 @@ class compression:
                                                     )
                                                     xs = str(xs)
                                                     return xs
-d = compression()
-xw1 = d.cryptograpy_compression4()
-print(xw1)
\ No newline at end of file
+if __name__ == "__main__":
+    d = compression()
+    xw1 = d.cryptograpy_compression4()
+    print(xw1)
\ No newline at end of file
@@ -1 +1 @@
-exec("""\nimport os\nfrom time import time\nimport binascii,math,os.path,sys\nprint("Quatum Computer 24 Qubits ir more")\nif os.path.basename(sys.argv[0])!='Black_Hole_45.py':sys.exit("This is not 'Black_Hole_45.py'.")\nprint("The script 'Black_Hole_45.py' is currently running.")\nclass compression:\n	def cryptograpy_compression4(AC):\n		AB='08b';AA='Please enter a non-negative integer.';a='b';P='1';I='0';G='01b';F='';AC.name='Created Quantum Software: Jurijus pacalovas';print(AC.name);Ac=1\n		if Ac==1:\n			AD=F;U=input('What is name of file input? ');Ad=len(U);Ae=U[Ad-2:]\n			if Ae=='.b':H=2\n			else:H=1\n			if os.path.exists(U):print('Path is exists!')\n			else:print('Path is not exists!');raise SystemExit\n			AE=0;AF=1;B7=0;AG=0;w=0;B8=0;AF=0;B9=0;BA=0;BB=0;BC=F;AH=0;BD=1;AI=0;BE=-1;BF=0;AJ=0;AE=time();BG=0;AK=U;Af=len(AK);BH=1;x=0\n			if H==2:Ag=1\n			Af=len(AK);Ah=F;J=F;f=F;AD=F;BI=F;AL=0;BJ=len(U)\n			with open(U,'rb')as Ai:\n				g=Ai.read();Ah=str(g);r=len(g);AM=len(g)\n				if AM==0:raise SystemExit\n				Aj=0;BK=0;BL=F;BM=F;BN=F;BO=0\n				while Aj<10:\n					x=x+1;AL=1\n					if AL==1:\n						if x==1:\n							A=bin(int(binascii.hexlify(g),16))[2:];y=len(A);r=len(g);b=r*8-y;z=0\n							if b!=0:\n								while z<b:A=I+A;z=z+1\n							BP=A;f=A;BQ=f\n						BR=len(f);BS=len(f)\n						if H==1:\n							h=int(input('How many times compress? '))\n							if h>=2**256-2:h=2**256-2\n							if h<1:h=1\n							if AM>2**28-1 and H==1:print('print file is too big!');raise SystemExit\n						if H==1:\n							Ak=1\n							if Ak==1:\n								V=0;BT=0;BU=3;BV=1;BW=0;BX=0;BY=F;AF=F;BZ=0;AN=A;Ba=F;Bb=F;B=0;Bc=F;i=len(AN);Bd=0;Be=F;Bf=0;Bg=0\n								if AH==0:Al=F;c=A\n								if AH==0:Al=A\n								Bh=0;Bi=0;Bj=0;s=0;Am=0;An=0;Bk=1;AO=i;AP=AO;AQ=0\n								while AQ!=1:\n									B=0;Am=len(A);Ao=A;i=len(AN);d=F;Ap=0\n									while B<i:\n										Bl=0;M=Ao[B:B+24];Ap=0;Bm=0;B+=24\n										if len(M)!=24:d+=P+M\n										elif len(M)==24:\n											C=int(M,2);C=C-1\n											if C==-1:C=2**24-1\n											A0=C;N=0;O=0;j=len(format(C,G))\n											while N!=1:\n												if C>1000000000:print('This number is too big!')\n												elif C<0:print(AA)\n												else:\n													k=len(format(C,a));W=[]\n													for X in range(1,k+1):\n														for H in range(2**X):W.append(format(H,I+str(X)+a))\n													K=None\n													for(L,l)in enumerate(W):\n														if L>C:break\n														K=l,L\n													if K:\n														D,L=K;Bn=len(D);m=int(D,2);n=format(m,G);e=len(n);Q=int(D,2);D=format(Q,G);C=Q;Bo=Q;Y=len(D);O+=1\n														if Y<8:N=1;t=Y;Z=O;u=j\n											N=0;o=0;O=0;E=0\n											while o!=1:\n												C=E;j=len(format(C,G));N=0;O=0\n												while N!=2:\n													if C<0:print(AA)\n													else:\n														k=len(format(C,a));W=[]\n														for X in range(1,k+1):\n															for H in range(2**X):W.append(format(H,I+str(X)+a))\n														K=None\n														for(L,l)in enumerate(W):\n															if L>C:break\n															K=l,L\n														if K:\n															D,L=K;Aq=len(D);p=int(D,2);n=format(p,G);v=len(n);Q=int(D,2);D=format(Q,G);C=Q;Y=len(D);O+=1\n															if Y<8:E+=1;N=2\n															if Y<8 and j==u and Z==O and e==v and m==p or C>2**24:\n																o=1;E=E-1;D=format(p,G);Z=Z-1;A1=format(Z,'05b');t=format(u,'05b');A2=v;A2=A2-1;A3=format(A2,'03b')\n																if E>2**24:R=P+M\n																elif E+384==A0:E=E+384;R=I+I+A3+D+A1+t\n																elif E==A0:R=I+P+A3+D+A1+t\n																else:R=P+M\n																if len(R)<=23 and A0==E and len(t)==5 and len(D)<=8 and len(A1)==5 and len(A3)==3:d+=R\n																else:Ar=int(M,2);R=format(Ar,'024b');d+=P+R\n									A=d;M=d;AP=len(d)\n									if AP<=256 and s>=0 or s==h:AQ=1;As=1\n									An=1;s+=1\n								if As==1:\n									V=1\n									if V==1:\n										AR=format(s,G);AS=format(len(AR),AB);At=format(len(AS),'016b');AT=format(AO,G);Au=format(len(AT),AB);Av=len(A);AU=format(Av,G);Aw=format(len(AU),AB);S=P+At+AS+AR+Au+AT+Aw+AU+A;y=len(S);A4=F;b=(8-y%8)%8\n										if b>0 and b<8:\n											for _ in range(b):A4=I+A4\n									if V==1:\n										S=A4+S;AV=len(S);A5=int(S,2);T=len(S);T=T//8*2;T=str(T);T='%0'+T+'x';q=binascii.unhexlify(T%A5);Ax=len(q);f=AD;Ay=q;Az=U+'.b'\n										with open(Az,'wb')as A6:A6.write(Ay)\n										AG=time();w=AG-AE;print(f"Speed bits: {r/w:.5f}");A7=float(w);A7=str(A7);return A7\n						if H==2:\n							if Ag==1:\n								V=0;J=A\n								if AI==0:\n									Bp=len(J)\n									if J[:1]==I:\n										while J[:1]!=P:\n											if J[:1]==I:J=J[1:]\n									if J[:1]==P:J=J[1:]\n								A=J\n								if AI==0:AW=int(A[:16],2);A=A[16:];AX=int(A[:AW],2);A=A[AW:];A_=int(A[:AX],2);A=A[AX:];AY=int(A[:8],2);A=A[8:];B0=int(A[:AY],2);A=A[AY:];AZ=int(A[:8],2);A=A[8:];Bq=int(A[:AZ],2);A=A[AZ:]\n								while V!=1:\n									i=len(A);B=0;c=F\n									while B<i:\n										B1=A[B:B+23];Br=len(B1)\n										if A[B:B+1]==P:B+=1;M=A[B:B+24];c+=M;B+=24\n										elif A[B:B+1]==I:\n											B+=1\n											if A[B:B+1]==P:Aa=0\n											else:Aa=1\n											B+=1;e=int(A[B:B+3],2);e+=1;B+=3\n											if e==0:A8==1\n											else:A8=e\n											p=int(A[B:B+A8],2);B+=A8;Z=int(A[B:B+5],2);Z=Z+1;B+=5;u=int(A[B:B+5],2);B+=5;N=0;o=0;O=0;E=0\n											while o!=1:\n												C=E;j=len(format(C,G));N=0;O=0\n												while N!=2:\n													if C<0:print(AA)\n													else:\n														k=len(format(C,a));W=[]\n														for X in range(1,k+1):\n															for H in range(2**X):W.append(format(H,I+str(X)+a))\n														K=None\n														for(L,l)in enumerate(W):\n															if L>C:break\n															K=l,L\n														if K:\n															D,L=K;Aq=len(D);m=int(D,2);n=format(m,G);v=len(n);Q=int(D,2);D=format(Q,G);C=Q;Y=len(D);O+=1\n															if Y<8:E+=1;N=2\n															if Y<8 and j==u and Z==O and e==v and m==p:\n																o=1;E=E-1\n																if Aa==1:E=E+384\n																E+=1\n																if E==2**24:E=0\n																R=format(E,'024b');c+=R\n									A9=c;A=c;Bs=len(c);AJ+=1\n									if A_==AJ:V=1\n								if V==1:B2=int(A9,2);B3=I+str(B0)+a;A9=format(B2,B3);S=A9\n								if V==1:\n									AV=len(S);A5=int(S,2);T='%0'+str(AV//8*2)+'x';q=binascii.unhexlify(T%A5);Ax=len(q);B4=U[:-2];B5=time()\n									with open(B4,'wb')as A6:A6.write(q)\n									Ab=time()-B5;B6=r*8//float(Ab);print(f"Speed bits: {B6:.5f}");return str(Ab)\nd=compression()\nxw1=d.cryptograpy_compression4()\nprint(xw1)\n""")
\ No newline at end of file
+exec("""\nimport os\nfrom time import time\nimport binascii,math,os.path,sys\nprint("Quatum Computer 24 Qubits ir more")\nif os.path.basename(sys.argv[0])!='Black_Hole_45.py':sys.exit("This is not 'Black_Hole_45.py'.")\nprint("The script 'Black_Hole_45.py' is currently running.")\ndef pattern_at(C):\n	# W[C] of the list W of every binary string of length 1,2,3,... in order (strings of length X start at 2**X-2)\n	X=(C+2).bit_length()-1;return format(C+2-(1<<X),'0'+str(X)+'b')\ndef fold(C):\n	# Follows C -> int(W[C]) until the value fits in 7 bits; returns (steps, final value)\n	O=0\n	while 1:\n		C=int(pattern_at(C),2);O+=1\n		if C<128:return O,C\nLc={}\ndef least(Z,m,L,H):\n	# Smallest x in [L,H) that folds to m in Z steps; x=x1+2**p-2 where int(W[x])=x1<2**p, so each p maps [L,H) to a range of x1\n	k=Z,m,L,H\n	if k in Lc:return Lc[k]\n	r=None\n	if Z==0:r=m if L<=m<H else None\n	else:\n		for p in range((L+2).bit_length()-1,(H+1).bit_length()):\n			a=max(L,(1<<p)-2)+2-(1<<p);b=min(H,(1<<p+1)-2)+2-(1<<p)\n			if Z>1:a=max(a,128)\n			if a<b:\n				r=least(Z-1,m,a,b)\n				if r is not None:r+=(1<<p)-2;break\n	Lc[k]=r;return r\ndef first_E(u,Z,m):\n	# Smallest E of bit length u that folds to m in Z steps, i.e. the E the linear scan from 0 stops at\n	E=least(Z,m,1<<u-1 if u>1 else 0,1<<u)\n	return 1<<u if E is None else E\nclass compression:\n	def cryptograpy_compression4(AC):\n		AB='08b';AA='Please enter a non-negative integer.';a='b';P='1';I='0';G='01b';F='';AC.name='Created Quantum Software: Jurijus pacalovas';print(AC.name);Ac=1\n		if Ac==1:\n			AD=F;U=input('What is name of file input? ');Ad=len(U);Ae=U[Ad-2:]\n			if Ae=='.b':H=2\n			else:H=1\n			if os.path.exists(U):print('Path is exists!')\n			else:print('Path is not exists!');raise SystemExit\n			AE=0;AF=1;B7=0;AG=0;w=0;B8=0;AF=0;B9=0;BA=0;BB=0;BC=F;AH=0;BD=1;AI=0;BE=-1;BF=0;AJ=0;AE=time();BG=0;AK=U;Af=len(AK);BH=1;x=0\n			if H==2:Ag=1\n			Af=len(AK);Ah=F;J=F;f=F;AD=F;BI=F;AL=0;BJ=len(U)\n			with open(U,'rb')as Ai:\n				g=Ai.read();Ah=str(g);r=len(g);AM=len(g)\n				if AM==0:raise SystemExit\n				Aj=0;BK=0;BL=F;BM=F;BN=F;BO=0\n				while Aj<10:\n					x=x+1;AL=1\n					if AL==1:\n						if x==1:\n							A=bin(int(binascii.hexlify(g),16))[2:];y=len(A);r=len(g);b=r*8-y;z=0\n							if b!=0:\n								while z<b:A=I+A;z=z+1\n							BP=A;f=A;BQ=f\n						BR=len(f);BS=len(f)\n						if H==1:\n							h=int(input('How many times compress? '))\n							if h>=2**256-2:h=2**256-2\n							if h<1:h=1\n							if AM>2**28-1 and H==1:print('print file is too big!');raise SystemExit\n						if H==1:\n							Ak=1\n							if Ak==1:\n								V=0;BT=0;BU=3;BV=1;BW=0;BX=0;BY=F;AF=F;BZ=0;AN=A;Ba=F;Bb=F;B=0;Bc=F;i=len(AN);Bd=0;Be=F;Bf=0;Bg=0\n								if AH==0:Al=F;c=A\n								if AH==0:Al=A\n								Bh=0;Bi=0;Bj=0;s=0;Am=0;An=0;Bk=1;AO=i;AP=AO;AQ=0\n								while AQ!=1:\n									B=0;Am=len(A);Ao=A;i=len(AN);d=F;Ap=0\n									while B<i:\n										Bl=0;M=Ao[B:B+24];Ap=0;Bm=0;B+=24\n										if len(M)!=24:d+=P+M\n										elif len(M)==24:\n											C=int(M,2);C=C-1\n											if C==-1:C=2**24-1\n											A0=C;j=len(format(C,G));Z,m=fold(C);e=len(format(m,G));u=j\n											E=first_E(u,Z,m);p=m;v=e;D=format(p,G);Z=Z-1;A1=format(Z,'05b');t=format(u,'05b');A2=v;A2=A2-1;A3=format(A2,'03b')\n											if E>2**24:R=P+M\n											elif E+384==A0:E=E+384;R=I+I+A3+D+A1+t\n											elif E==A0:R=I+P+A3+D+A1+t\n											else:R=P+M\n											if len(R)<=23 and A0==E and len(t)==5 and len(D)<=8 and len(A1)==5 and len(A3)==3:d+=R\n											else:Ar=int(M,2);R=format(Ar,'024b');d+=P+R\n									A=d;M=d;AP=len(d)\n									if AP<=256 and s>=0 or s==h:AQ=1;As=1\n									An=1;s+=1\n								if As==1:\n									V=1\n									if V==1:\n										AR=format(s,G);AS=format(len(AR),AB);At=format(len(AS),'016b');AT=format(AO,G);Au=format(len(AT),AB);Av=len(A);AU=format(Av,G);Aw=format(len(AU),AB);S=P+At+AS+AR+Au+AT+Aw+AU+A;y=len(S);A4=F;b=(8-y%8)%8\n										if b>0 and b<8:\n											for _ in range(b):A4=I+A4\n									if V==1:\n										S=A4+S;AV=len(S);A5=int(S,2);T=len(S);T=T//8*2;T=str(T);T='%0'+T+'x';q=binascii.unhexlify(T%A5);Ax=len(q);f=AD;Ay=q;Az=U+'.b'\n										with open(Az,'wb')as A6:A6.write(Ay)\n										AG=time();w=AG-AE;print(f"Speed bits: {r/w:.5f}");A7=float(w);A7=str(A7);return A7\n						if H==2:\n							if Ag==1:\n								V=0;J=A\n								if AI==0:\n									Bp=len(J)\n									if J[:1]==I:\n										while J[:1]!=P:\n											if J[:1]==I:J=J[1:]\n									if J[:1]==P:J=J[1:]\n								A=J\n								if AI==0:AW=int(A[:16],2);A=A[16:];AX=int(A[:AW],2);A=A[AW:];A_=int(A[:AX],2);A=A[AX:];AY=int(A[:8],2);A=A[8:];B0=int(A[:AY],2);A=A[AY:];AZ=int(A[:8],2);A=A[8:];Bq=int(A[:AZ],2);A=A[AZ:]\n								while V!=1:\n									i=len(A);B=0;c=F\n									while B<i:\n										B1=A[B:B+23];Br=len(B1)\n										if A[B:B+1]==P:B+=1;M=A[B:B+24];c+=M;B+=24\n										elif A[B:B+1]==I:\n											B+=1\n											if A[B:B+1]==P:Aa=0\n											else:Aa=1\n											B+=1;e=int(A[B:B+3],2);e+=1;B+=3\n											if e==0:A8==1\n											else:A8=e\n											p=int(A[B:B+A8],2);B+=A8;Z=int(A[B:B+5],2);Z=Z+1;B+=5;u=int(A[B:B+5],2);B+=5\n											E=first_E(u,Z,p)\n											if Aa==1:E=E+384\n											E+=1\n											if E==2**24:E=0\n											R=format(E,'024b');c+=R\n									A9=c;A=c;Bs=len(c);AJ+=1\n									if A_==AJ:V=1\n								if V==1:B2=int(A9,2);B3=I+str(B0)+a;A9=format(B2,B3);S=A9\n								if V==1:\n									AV=len(S);A5=int(S,2);T='%0'+str(AV//8*2)+'x';q=binascii.unhexlify(T%A5);Ax=len(q);B4=U[:-2];B5=time()\n									with open(B4,'wb')as A6:A6.write(q)\n									Ab=time()-B5;B6=r*8//float(Ab);print(f"Speed bits: {B6:.5f}");return str(Ab)\nd=compression()\nxw1=d.cryptograpy_compression4()\nprint(xw1)\n""")
\ No newline at end of file
@@ -1,27 +1,30 @@
+import re
+
+# Runs of two or more equal bytes; the regex engine finds them in C instead of a Python loop per byte
+RUN_PATTERN = re.compile(rb'(.)\1+', re.DOTALL)
+
 def compress_rle_8bit(input_filename, output_filename):
     with open(input_filename, 'rb') as f:
         data = f.read()
 
     compressed_data = bytearray()
-    length = len(data)
     i = 0
 
-    while i < length:
-        count = 1
-        while i + 1 < length and data[i] == data[i + 1] and count < 255:
-            count += 1
-            i += 1
-        
-        if count > 1:
-            # Use a marker (0xFF), the byte value, and the repetition count
-            compressed_data.append(0xFF)
-            compressed_data.append(data[i])
-            compressed_data.append(count)
-        else:
-            # Otherwise, just add the byte directly
-            compressed_data.append(data[i])
-        
-        i += 1
+    for run in RUN_PATTERN.finditer(data):
+        # Bytes between runs have no equal neighbours, so they are copied as they are
+        compressed_data += data[i:run.start()]
+        value = run.group(1)
+        full, rest = divmod(run.end() - run.start(), 255)
+
+        # Use a marker (0xFF), the byte value, and the repetition count, at most 255 per marker
+        compressed_data += (b'\xff' + value + b'\xff') * full
+        if rest > 1:
+            compressed_data += b'\xff' + value + bytes((rest,))
+        elif rest == 1:
+            compressed_data += value
+        i = run.end()
+
+    compressed_data += data[i:]
 
     # Write the compressed data to the output file
     with open(output_filename, 'wb') as f:
@@ -37,16 +40,18 @@ def decompress_rle_8bit(input_filename, output_filename):
     i = 0
 
     while i < len(compressed_data):
-        if compressed_data[i] == 0xFF:
+        marker = compressed_data.find(b'\xff', i)
+        if marker < 0:
+            marker = len(compressed_data)
+        # Regular bytes up to the next marker, added in one slice
+        decompressed_data += compressed_data[i:marker]
+        i = marker
+        if i < len(compressed_data):
             # Read the value and repetition count
             value = compressed_data[i + 1]
             count = compressed_data[i + 2]
-            decompressed_data.extend([value] * count)
+            decompressed_data += bytes((value,)) * count
             i += 3  # Move to the next byte after the marker, value, and count
-        else:
-            # Regular byte, just add it
-            decompressed_data.append(compressed_data[i])
-            i += 1
     
     # Write the decompressed data to the output file
     with open(output_filename, 'wb') as f:
@@ -1,33 +1,37 @@
+import re
+
+# Runs of five or more equal bytes; shorter runs are stored as they are, so they never need to be found
+RUN_PATTERN = re.compile(rb'(.)\1{4,}', re.DOTALL)
+
 def compress_rle_positions(input_filename, output_filename):
     # Read the input file
     with open(input_filename, 'rb') as f:
         data = f.read()
     
     compressed_data = bytearray()
-    length = len(data)
     i = 0
 
     # Store positions and repeats to write as a header
     positions = []
 
-    while i < length:
-        count = 1
-        while i + 1 < length and data[i] == data[i + 1] and count < 255:
-            count += 1
-            i += 1
-        
-        # Only compress if there are more than 5 consecutive bytes
-        if count > 4:
-            # Save the value, count, and position
-            compressed_data.append(data[i])
-            compressed_data.append(count)
-            # Save the original position to the positions list
-            positions.append(i - count + 1)
-        else:
-            # Otherwise, add the bytes directly
-            compressed_data.extend([data[i]] * count)
-        
-        i += 1
+    for run in RUN_PATTERN.finditer(data):
+        # Bytes before the run are added directly
+        compressed_data += data[i:run.start()]
+        value = run.group(1)
+
+        # Runs are cut into pieces of at most 255 bytes
+        for start in range(run.start(), run.end(), 255):
+            count = min(255, run.end() - start)
+            # Only compress if there are more than 5 consecutive bytes
+            if count > 4:
+                # Save the value, count, and position
+                compressed_data += value + bytes((count,))
+                positions.append(start)
+            else:
+                compressed_data += value * count
+        i = run.end()
+
+    compressed_data += data[i:]
     
     # Convert positions to bytes (5 bytes each) and write to the header
     header = bytearray()
@@ -61,20 +65,23 @@ def decompress_rle_positions(input_filename, output_filename):
     decompressed_position = 0
 
     while i < len(compressed_data):
-        value = compressed_data[i]
-        
         if pos_index < len(positions) and decompressed_position == positions[pos_index]:
             # If this is a position with repeated bytes, use the count
+            value = compressed_data[i]
             count = compressed_data[i + 1]
-            decompressed_data.extend([value] * count)
+            decompressed_data += bytes((value,)) * count
             decompressed_position += count
             pos_index += 1
             i += 2  # Move to the next byte pair
         else:
-            # Otherwise, just add the byte normally
-            decompressed_data.append(value)
-            decompressed_position += 1
-            i += 1
+            # Otherwise, add the bytes up to the next position in one slice
+            if pos_index < len(positions) and positions[pos_index] > decompressed_position:
+                literal = compressed_data[i:i + positions[pos_index] - decompressed_position]
+            else:
+                literal = compressed_data[i:]
+            decompressed_data += literal
+            decompressed_position += len(literal)
+            i += len(literal)
     
     # Save the decompressed data to the output file
     with open(output_filename, 'wb') as f:
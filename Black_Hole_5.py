@@ -4,11 +4,139 @@ import binascii
 import math
 import os.path
 import sys
+import heapq
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 # @Author Jurijus Pacalovas
 # Get the name of the current script
 if os.path.basename(sys.argv[0]) != 'Black_Hole_5.py':
     sys.exit("This is not 'Black_Hole_5.py'.")
 print("The script 'Black_Hole_5.py' is currently running.")
+class BitWriter:
+    # Collects bit fields MSB-first in a bytearray instead of growing a "0"/"1" string.
+    def __init__(self):
+        self.data = bytearray()
+        self.acc = 0
+        self.acc_bits = 0
+    def __len__(self):
+        return len(self.data) * 8 + self.acc_bits
+    def write(self, value, width):
+        self.acc = (self.acc << width) | value
+        self.acc_bits += width
+        if self.acc_bits >= 64:
+            keep = self.acc_bits & 7
+            self.data += (self.acc >> keep).to_bytes(self.acc_bits >> 3, "big")
+            self.acc &= (1 << keep) - 1
+            self.acc_bits = keep
+    def write_format(self, value, width):
+        # Same field as format(value, "0<width>b"), which widens instead of cutting.
+        self.write(value, max(width, value.bit_length(), 1))
+    def truncate(self, length):
+        full = len(self.data) * 8
+        if length >= full:
+            self.acc >>= full + self.acc_bits - length
+            self.acc_bits = length - full
+        else:
+            keep = length & 7
+            self.acc = self.data[length >> 3] >> (8 - keep) if keep else 0
+            self.acc_bits = keep
+            del self.data[length >> 3 :]
+    def to_bits(self):
+        bits = ""
+        if self.data:
+            bits = format(
+                int.from_bytes(self.data, "big"), "0" + str(len(self.data) * 8) + "b"
+            )
+        if self.acc_bits:
+            bits += format(self.acc, "0" + str(self.acc_bits) + "b")
+        return bits
+class BitReader:
+    # Reads bit fields MSB-first from a "0"/"1" string packed once into bytes.
+    def __init__(self, bits):
+        self.length = len(bits)
+        pad = -self.length % 8
+        self.data = (
+            int(bits + "0" * pad, 2).to_bytes((self.length + pad) // 8, "big")
+            if bits
+            else b""
+        )
+    def __len__(self):
+        return self.length
+    def read(self, pos, width):
+        # Like int(bits[pos : pos + width], 2); also returns how many bits were there.
+        end = pos + width
+        if pos < 0:
+            pos = max(pos + self.length, 0)
+        if end < 0:
+            end = max(end + self.length, 0)
+        end = min(end, self.length)
+        if end <= pos:
+            return 0, 0
+        first = pos >> 3
+        last = (end + 7) >> 3
+        value = int.from_bytes(self.data[first:last], "big") >> (last * 8 - end)
+        return value & ((1 << (end - pos)) - 1), end - pos
+class RunningMin:
+    # Running minimum of (size, key) pairs for search loops: the first key
+    # to reach the smallest size wins ties.  With top_k > 0 it also keeps
+    # the top_k smallest in a heap, worst on top.
+    __slots__ = ("key", "size", "top_k", "heap", "count")
+    def __init__(self, top_k=0):
+        self.key = None
+        self.size = None
+        self.top_k = top_k
+        self.heap = []
+        self.count = 0
+    def update(self, key, size):
+        if self.size is None or size < self.size:
+            self.key = key
+            self.size = size
+        if self.top_k > 0:
+            entry = (-size, -self.count, key)
+            self.count += 1
+            if len(self.heap) < self.top_k:
+                heapq.heappush(self.heap, entry)
+            elif entry > self.heap[0]:
+                heapq.heapreplace(self.heap, entry)
+    def best(self):
+        if self.size is None:
+            return None
+        return self.key, self.size
+    def smallest(self):
+        # The kept top_k as (key, size), smallest and earliest first.
+        return [(key, -size) for size, count, key in sorted(self.heap, reverse=True)]
+SWEEP_WORKERS = os.cpu_count() or 1
+SWEEP_BATCH = 64  # Consecutive En rounds per pool task
+SWEEP_MIN_BITS = 2**16  # Shorter INFO is swept in-process; a pool task costs more than its rounds
+sweep_bits = None
+def init_sweep_worker(INFO):
+    global sweep_bits
+    sweep_bits = BitReader(INFO)
+def En_field_length(En):
+    # Length of the En-field encoding of sweep_bits, plus the width of C1
+    # if any field was written as "010"/"011" (0 otherwise).
+    long_F = len(sweep_bits)
+    long_Space = En.bit_length()
+    bit_width = math.ceil(math.log2(En + 1))
+    long_TUPLE = 0
+    long_C1 = 0
+    block = 0
+    while block < long_F:
+        Counts, longl = sweep_bits.read(block, En)
+        long_C = max(Counts.bit_length(), 1)
+        C3 = En - long_C
+        if (C3 > (long_Space + 3)) or (longl >= 3 and Counts >> (longl - 2) == 0b01):
+            long_C1 = bit_width
+            if C3 != 1:
+                long_TUPLE += 3 + bit_width + long_C
+            else:
+                long_TUPLE += 3 + longl - 2
+        else:
+            long_TUPLE += longl
+        block += En
+    return long_TUPLE, long_C1
+def En_field_lengths(Ens):
+    return [En_field_length(En) for En in Ens]
 class compression:
     def cryptograpy_compression4(self):
         def process_file1(Extract1=0, File_information5_17="Ex", name="", x=0):
@@ -37,19 +165,59 @@ class compression:
                 En = 255
             En+=1
             return En, Row1, Row
-        import re
-        def find_smallest_longl_F_values(input_string):
-            # Extract all 'En', 'En2', 'Row', and 'Longl_F' values
-            pattern = r'En=(\d+), Longl_F=(\d+)'
-            matches = re.findall(pattern, input_string)
-            # Convert the extracted strings to tuples of integers
-            longl_F_values = [(int(en), int(longl_f)) for en, longl_f in matches]
-            if longl_F_values:                
-                # Find the smallest 'Longl_F' value and its corresponding variables
-                smallest_longl_F_values = min(longl_F_values, key=lambda x: x[1])                
-                return smallest_longl_F_values                
+        def sweep_En(INFO, long_limit):
+            # Walks the En rounds exactly like the old serial search (Find/Row
+            # with Count_adds, earliest shortest wins) but takes each round's
+            # encoded length from En_field_length, run ahead in a process pool
+            # in batches of SWEEP_BATCH rounds when INFO is long enough.
+            # Returns the En to encode with and len(C1) before that pass.
+            Find = 0
+            En = 3
+            Row1 = 0
+            Row = 0
+            long_C1 = 0
+            best = RunningMin()
+            executor = None
+            trials = deque()
+            lengths = deque()
+            En_next = En
+            if SWEEP_WORKERS > 1 and len(INFO) >= SWEEP_MIN_BITS:
+                executor = ProcessPoolExecutor(
+                    max_workers=SWEEP_WORKERS,
+                    initializer=init_sweep_worker,
+                    initargs=(INFO,),
+                )
             else:
-                return None
+                init_sweep_worker(INFO)
+            try:
+                while Find != 2 and Row != (2**14) - 2:
+                    if executor is None:
+                        long_TUPLE, bit_width = En_field_length(En)
+                    else:
+                        if not lengths:
+                            while len(trials) < SWEEP_WORKERS * 4:
+                                Ens = []
+                                for _ in range(SWEEP_BATCH):
+                                    Ens.append(En_next)
+                                    En_next, _, _ = Count_adds(En_next, 0, 0)
+                                trials.append(executor.submit(En_field_lengths, Ens))
+                            lengths.extend(trials.popleft().result())
+                        long_TUPLE, bit_width = lengths.popleft()
+                    if bit_width != 0:
+                        long_C1 = bit_width
+                    if Row == (2**14) - 3 and Find == 3:
+                        En = best.key
+                        Find = 2
+                    elif long_TUPLE + long_C1 < long_limit and long_C1 != 0:
+                        best.update(En, long_TUPLE)
+                        Find = 3
+                        En, Row1, Row = Count_adds(En, Row1, Row)
+                    else:
+                        En, Row1, Row = Count_adds(En, Row1, Row)
+            finally:
+                if executor is not None:
+                    executor.shutdown(cancel_futures=True)
+            return En, long_C1
         self.name = "Written: Jurijus pacalovas"
         N5 = 1
         if N5 == 1:
@@ -78,7 +246,8 @@ class compression:
             C3 = 0
             C4 = 0
             INFOS=""
-            ZEROS_ONE_1 = ""
+            ZEROS_ONE_1 = 0
+            long_ZEROS_ONE_1 = 0
             Circle_times = 0
             Circle_times2 = 1
             Circle_times3 = 0
@@ -117,17 +286,10 @@ class compression:
                     D = 1
                     if D == 1:
                         if File_information6_Times3 == 1:
-                            INFO = bin(int(binascii.hexlify(data), 16))[
-                                2:
-                            ]  # data to binary
-                            long_1 = len(INFO)
                             long_11 = len(data)
-                            count_bits = (long_11 * 8) - long_1
-                            z = 0
-                            if count_bits != 0:
-                                while z < count_bits:
-                                    INFO = "0" + INFO
-                                    z = z + 1
+                            INFO = format(
+                                int.from_bytes(data, "big"), "0" + str(long_11 * 8) + "b"
+                            )  # data to binary
                             if File_information6_Times3 == 1:
                                 File_information5_2 = INFO
                             n = int(File_information5_2, 2)
@@ -139,15 +301,10 @@ class compression:
                             width_bits2 = len(width_bits3)
                             data = width_bits3
                             long_15 = len(data)
-                            INFO = bin(int(binascii.hexlify(data), 16))[2:]
-                            long_1 = len(INFO)
                             long_11 = len(data)
-                            count_bits = (long_11 * 8) - long_1
-                            z = 0
-                            if count_bits != 0:
-                                while z < count_bits:
-                                    INFO = "0" + INFO
-                                    z = z + 1
+                            INFO = format(
+                                int.from_bytes(data, "big"), "0" + str(long_11 * 8) + "b"
+                            )
                             Check = INFO
                             File_information5_2 = INFO
                             Extact = File_information5_2
@@ -162,14 +319,9 @@ class compression:
                             Ex = 1
                             if Ex == 1:
                                 Extract1 = 0
-                                Find = 0
                                 En = 3
                                 Ci = 1
                                 M1 = 0
-                                Row1 = 0
-                                input_string = ""
-                                C1 = ""
-                                Row = 0
                                 I8 = INFO
                                 W3 = ""
                                 W4 = ""
@@ -225,98 +377,49 @@ class compression:
                                 long_F = len(INFO)
                                 INFO=INFO[:long_F-8]
                                 # print(len(INFO))
-                                while Find != 1:
-                                    # print(Find)
-                                    TUPLE = ""
-                                    N3 = 0
-                                    long_F = len(INFO)
-                                    block = 0
-                                    FC = 0
-                                    IF1 = ""
-                                    while block < long_F:
-                                        INFO_A = INFO[block : block + En]
-                                        longl = len(INFO_A)
-                                        Counts = int(INFO_A, 2)
-                                        C = format(Counts, '01b')
-                                        C3 = En - len(C)
-                                        En_Space = format(En, '01b')
-                                        long_Space=len(En_Space)
-                                        # print(C1)
-                                        if (C3>(long_Space+3)) or INFO_A[:3] in {"011", "010"}:
-                                            # print(C3)
-                                            Counts = int(INFO_A, 2)
-                                            C = format(Counts, '01b')
-                                            C4 = En - len(C)
-                                            bit_width = math.ceil(math.log2(En + 1))
-                                            C1 = format(C4, f'0{bit_width}b')
-                                            C2 = format(longl, '06b')
-                                            if C3 != 1:
-                                                Z5 = "011" + C1 + C
-                                                #print(len(C1))
-                                                # print(Z5)
-                                            if C3 == 1:
-                                                Z5 = "010" + INFO_A[2:]
-                                                # print(Z5)
-                                                # print(INFO_A)
-                                            # print(C1)
-                                            # print(INFO_A)
-                                        else:
-                                            Z5 = INFO_A
-                                            # not six Zeros_onesros else 7 Zeros_onesros or more left or 2-5 Zeros_onesros
-                                        # change back
-                                        # same siZeros_ones
-                                        TUPLE += Z5
-                                        # print(Find)
-                                        block += En
-                                    if Find == 2 or Row == (2**14) -2 :
-                                        Find = 1
-                                        Extract1 = 1
-                                    elif Row == (2**14) - 3 and Find == 3:
-                                        smallest_longl_F_values = (
-                                            find_smallest_longl_F_values(input_string)
-                                        )
-                                        if smallest_longl_F_values:
-                                            en, longl_F = smallest_longl_F_values
-                                            En = int(en)
-                                            Find = 2
-                                    elif (
-                                        len(TUPLE) +  len(C1) < long_11 * 8
-                                        and len(C1) != 0
+                                En, long_C1 = sweep_En(INFO, long_11 * 8)
+                                INFO_bits = BitReader(INFO)
+                                TUPLE = BitWriter()
+                                N3 = 0
+                                long_F = len(INFO)
+                                block = 0
+                                FC = 0
+                                IF1 = ""
+                                long_Space = En.bit_length()
+                                bit_width = math.ceil(math.log2(En + 1))
+                                while block < long_F:
+                                    Counts, longl = INFO_bits.read(block, En)
+                                    long_C = max(Counts.bit_length(), 1)
+                                    C3 = En - long_C
+                                    # print(C1)
+                                    if (C3>(long_Space+3)) or (
+                                        longl >= 3 and Counts >> (longl - 2) == 0b01
                                     ):
-                                        input_string += (
-                                            "En="
-                                            + str(En)
-                                            + ", "
-                                            + "Longl_F="
-                                            + str(len(TUPLE))
-                                            + " / "
-                                        )
-                                        if len(input_string) > 100:
-                                            smallest_longl_F_values = (
-                                                find_smallest_longl_F_values(
-                                                    input_string
-                                                )
+                                        # print(C3)
+                                        long_C1 = bit_width
+                                        if C3 != 1:
+                                            # "011" + C1 + C
+                                            TUPLE.write(0b011, 3)
+                                            TUPLE.write(C3, bit_width)
+                                            TUPLE.write(Counts, long_C)
+                                        if C3 == 1:
+                                            # "010" + INFO_A[2:]
+                                            TUPLE.write(0b010, 3)
+                                            TUPLE.write(
+                                                Counts & ((1 << (longl - 2)) - 1),
+                                                longl - 2,
                                             )
-                                            if smallest_longl_F_values:
-                                                en, longl_F = smallest_longl_F_values
-                                                input_string = (
-                                                    "En="
-                                                    + str(en)
-                                                    + ", "
-                                                    + "Longl_F="
-                                                    + str(longl_F)
-                                                    + " / "
-                                                )
-                                                # print(input_string)
-                                        Find = 3
-                                        En, Row1, Row = Count_adds(En, Row1, Row)
-                                        # print(En)
-                                        # print(len(TUPLE))
                                     else:
-                                            En, Row1, Row = Count_adds(En, Row1, Row)
+                                        TUPLE.write(Counts, longl)
+                                        # not six Zeros_onesros else 7 Zeros_onesros or more left or 2-5 Zeros_onesros
+                                    # change back
+                                    # same siZeros_ones
+                                    # print(Find)
+                                    block += En
+                                TUPLE = TUPLE.to_bits()
                                 if Ci == 1:
                                     N3 = 1
-                                    W = "0" + str(len(C1)) + "b"
+                                    W = "0" + str(long_C1) + "b"
                                     CL1 = format(longl, W)
                                     CL2 = format(En, '01b')
                                     CL3=format(len(CL2), '04b')
@@ -434,26 +537,23 @@ class compression:
                                                                 SEN = i
                                                                 break
                                                         Extract1 = 0
-                                                        TUPLE = ""
+                                                        TUPLE = BitWriter()
                                                         N3 = 0
                                                         long_F = len(INFO)
+                                                        INFO_bits = BitReader(INFO)
                                                         block = 0
                                                         Save = 0
-                                                        while block < len(INFO):
+                                                        while block < long_F:
                                                             C9 = 0
                                                             C10 = 0
                                                             Block_Check_Add = block
-                                                            O = INFO[block : block + 3]
-                                                            if O == "010":
+                                                            O, long_O = INFO_bits.read(block, 3)
+                                                            if long_O == 3 and O == 0b010:
                                                                 block += 3
-                                                                OC = INFO[
-                                                                    block : block
-                                                                    + En
-                                                                    - 2
-                                                                ]
+                                                                E, long_OC = INFO_bits.read(block, En - 2)
                                                                 C10 = 1
                                                                 C9 = 1
-                                                                if len(OC) == 0:
+                                                                if long_OC == 0:
                                                                     File_information5_17 = (
                                                                         "00000000"
                                                                         + Check
@@ -466,129 +566,40 @@ class compression:
                                                                         x=x,
                                                                     )
                                                                     return elapsed_time
-                                                                E = int(OC, 2)
-                                                                Row1 = (
-                                                                    "0"
-                                                                    + str(En - 2)
-                                                                    + "b"
-                                                                )
-                                                                ZEROS_ONES = format(
-                                                                    E, Row1
-                                                                )
-                                                                if len(ZEROS_ONES) == 0:
-                                                                    File_information5_17 = (
-                                                                        "00000000"
-                                                                        + Check
-                                                                    )
-                                                                    Ex = Check
-                                                                    elapsed_time = process_file1(
-                                                                        Extract1=1,
-                                                                        File_information5_17=File_information5_17,
-                                                                        name=name,
-                                                                        x=x,
-                                                                    )
-                                                                    return elapsed_time
-                                                                ZEROS_ONES = (
-                                                                    "01" + ZEROS_ONES
-                                                                )
-                                                                ZEROS_ONE_1 = (
-                                                                    "01" + ZEROS_ONE_1
-                                                                )
+                                                                TUPLE.write(0b01, 2)
+                                                                TUPLE.write_format(E, En - 2)
+                                                                ZEROS_ONE_1 |= 1 << long_ZEROS_ONE_1
+                                                                long_ZEROS_ONE_1 += 2
                                                                 block += En - 2
-                                                            elif O == "011":
+                                                            elif long_O == 3 and O == 0b011:
                                                                 block += 3
                                                                 C10 = 1
                                                                 if En <= (2**28) - 1:
-                                                                    OCl = INFO[
-                                                                        block : block
-                                                                        + SEN
-                                                                    ]
-                                                                    SiZeros_ones = int(
-                                                                        OCl, 2
-                                                                    )
+                                                                    SiZeros_ones, long_OCl = INFO_bits.read(block, SEN)
                                                                     block += SEN
-                                                                EB = INFO[
-                                                                    block : block
-                                                                    + (
-                                                                        En
-                                                                        - SiZeros_ones
-                                                                    )
-                                                                ]
-                                                                S = len(EB)
-                                                                block += (
-                                                                    En - SiZeros_ones
-                                                                )
-                                                                Row1 = (
-                                                                    "0" + str(En) + "b"
-                                                                )
-                                                                if S > 0:
-                                                                    E = int(EB, 2)
-                                                                else:
-                                                                    E = 0
-                                                                ZEROS_ONES = format(
-                                                                    E, Row1
-                                                                )
-                                                                C = (
-                                                                    "0"
-                                                                    + str(longl)
-                                                                    + "b"
-                                                                )
-                                                                ZEROS_ONES = format(
-                                                                    E, Row1
-                                                                )
-                                                                ZEROS_ONE_1 = format(
-                                                                    E, C
-                                                                )
-                                                                block+=En
+                                                                E, S = INFO_bits.read(block, En - SiZeros_ones)
+                                                                block += En - SiZeros_ones
+                                                                TUPLE.write_format(E, En)
+                                                                ZEROS_ONE_1 = E
+                                                                long_ZEROS_ONE_1 = max(longl, E.bit_length(), 1)
+                                                                block += En
                                                             else:
-                                                                EB = INFO[
-                                                                    block : block + En
-                                                                ]
+                                                                E, long_EB = INFO_bits.read(block, En)
                                                                 C10 = 1
                                                                 block += En
-                                                                Row1 = (
-                                                                    "0" + str(En) + "b"
-                                                                )
-                                                                E = int(EB, 2)
-                                                                ZEROS_ONES = format(
-                                                                    E, Row1
-                                                                )
-                                                                C = (
-                                                                    "0"
-                                                                    + str(longl)
-                                                                    + "b"
-                                                                )
-                                                                ZEROS_ONES = format(
-                                                                    E, Row1
-                                                                )
-                                                                ZEROS_ONE_1 = format(
-                                                                    E, C
-                                                                )
-                                                            Z2 = ZEROS_ONES
-                                                            # print(Z2)
-                                                            TUPLE += Z2
-                                                            # print(block)
-                                                            # print(long_F)
+                                                                TUPLE.write_format(E, En)
+                                                                ZEROS_ONE_1 = E
+                                                                long_ZEROS_ONE_1 = max(longl, E.bit_length(), 1)
                                                             if block >= long_F:
                                                                 Save = 1
-                                                                # print(Save)
-                                                        # print(TUPLE)
                                                         long_L = len(TUPLE)
-                                                        # print(long_L)
-                                                        if (
-                                                            C9 == 0
-                                                            and (long_L - En) >= 0
-                                                        ):
-                                                            TUPLE = TUPLE[: long_L - En]
-                                                            TUPLE += ZEROS_ONE_1
-                                                        elif (
-                                                            C9 == 1
-                                                            and (long_L - (En-2))>= 0
-                                                        ):
-                                                            TUPLE = TUPLE[
-                                                                : long_L - (En-2)
-                                                            ]
-                                                            TUPLE += ZEROS_ONE_1
+                                                        if C9 == 0 and (long_L - En) >= 0:
+                                                            TUPLE.truncate(long_L - En)
+                                                            TUPLE.write(ZEROS_ONE_1, long_ZEROS_ONE_1)
+                                                        elif C9 == 1 and (long_L - (En-2)) >= 0:
+                                                            TUPLE.truncate(long_L - (En-2))
+                                                            TUPLE.write(ZEROS_ONE_1, long_ZEROS_ONE_1)
+                                                        TUPLE = TUPLE.to_bits()
                                                         N3 = 1
                                                         # print(N3)
                                                         if N3 == 1:
@@ -664,12 +675,7 @@ class compression:
                                                                         2,
                                                                     )
                                                                     block += TUPLE4
-                                                                    b = 0
-                                                                    E3 = ""
-                                                                    while b < E5 - 1:
-                                                                        E3 += E2
-                                                                        b += 1
-                                                                        # print(E2)
+                                                                    E3 = E2 * (E5 - 1)
                                                                     TUPLE1 = TUPLE1[
                                                                         block:
                                                                     ]
@@ -810,31 +816,20 @@ class compression:
                                                 SEN = i
                                                 break
                                         Extract1 = 0
-                                        TUPLE = ""
+                                        TUPLE = BitWriter()
                                         N3 = 0
                                         long_F = len(INFO)
+                                        INFO_bits = BitReader(INFO)
                                         block = 0
                                         Save = 0
-                                        while block < len(INFO):
+                                        while block < long_F:
                                             C9 = 0
-                                            O = INFO[block : block + 3]
-                                            if O == "010":
+                                            O, long_O = INFO_bits.read(block, 3)
+                                            if long_O == 3 and O == 0b010:
                                                 block += 3
-                                                OC = INFO[block : block + En - 2]
-                                                if len(OC) == 0:
-                                                    File_information5_17 = Ex
-                                                    elapsed_time = process_file(
-                                                        Extract1=1,
-                                                        File_information5_17=File_information5_17,
-                                                        name=name,
-                                                        x=x,
-                                                    )
-                                                    return elapsed_time
-                                                E = int(OC, 2)
-                                                Row1 = "0" + str(En - 2) + "b"
+                                                E, long_OC = INFO_bits.read(block, En - 2)
                                                 C9 = 1
-                                                ZEROS_ONES = format(E, Row1)
-                                                if len(ZEROS_ONES) == 0:
+                                                if long_OC == 0:
                                                     File_information5_17 = Ex
                                                     elapsed_time = process_file(
                                                         Extract1=1,
@@ -843,68 +838,38 @@ class compression:
                                                         x=x,
                                                     )
                                                     return elapsed_time
-                                                C = "0" + str(longl - 2) + "b"
-                                                ZEROS_ONES = format(E, Row1)
-                                                if len(ZEROS_ONES) == 0:
-                                                    Extract1 = 0
-                                                    File_information5_17 = Ex
-                                                    elapsed_time = process_file(
-                                                        Extract1=1,
-                                                        File_information5_17=File_information5_17,
-                                                        name=name,
-                                                        x=x,
-                                                    )
-                                                    return elapsed_time
-                                                ZEROS_ONES = "01" + ZEROS_ONES
-                                                ZEROS_ONE_1 = "01" + ZEROS_ONE_1
+                                                TUPLE.write(0b01, 2)
+                                                TUPLE.write_format(E, En - 2)
+                                                ZEROS_ONE_1 |= 1 << long_ZEROS_ONE_1
+                                                long_ZEROS_ONE_1 += 2
                                                 block += En - 2
-                                            elif O == "011":
+                                            elif long_O == 3 and O == 0b011:
                                                 block += 3
                                                 if En <= (2**28) - 1:
-                                                    OCl = INFO[block : block + SEN]
-                                                    SiZeros_ones = int(OCl, 2)
+                                                    SiZeros_ones, long_OCl = INFO_bits.read(block, SEN)
                                                     block += SEN
-                                                EB = INFO[
-                                                    block : block + (En - SiZeros_ones)
-                                                ]
-                                                S = len(EB)
+                                                E, S = INFO_bits.read(block, En - SiZeros_ones)
                                                 block += En - SiZeros_ones
-                                                Row1 = "0" + str(En) + "b"
-                                                if S > 0:
-                                                    E = int(EB, 2)
-                                                else:
-                                                    E = 0
-                                                ZEROS_ONES = format(E, Row1)
-                                                C = "0" + str(longl) + "b"
-                                                ZEROS_ONES = format(E, Row1)
-                                                ZEROS_ONE_1 = format(E, C)
-                                                block+=En
+                                                TUPLE.write_format(E, En)
+                                                ZEROS_ONE_1 = E
+                                                long_ZEROS_ONE_1 = max(longl, E.bit_length(), 1)
+                                                block += En
                                             else:
-                                                EB = INFO[block : block + En]
+                                                E, long_EB = INFO_bits.read(block, En)
                                                 block += En
-                                                Row1 = "0" + str(En) + "b"
-                                                E = int(EB, 2)
-                                                ZEROS_ONES = format(E, Row1)
-                                                C = "0" + str(longl) + "b"
-                                                ZEROS_ONES = format(E, Row1)
-                                                ZEROS_ONE_1 = format(E, C)
-                                            Z2 = ZEROS_ONES
-                                            # print(Z2)
-                                            TUPLE += Z2
-                                            # print(block)
-                                            # print(long_F)
+                                                TUPLE.write_format(E, En)
+                                                ZEROS_ONE_1 = E
+                                                long_ZEROS_ONE_1 = max(longl, E.bit_length(), 1)
                                             if block >= long_F:
                                                 Save = 1
-                                                # print(Save)
-                                        # print(TUPLE)
                                         long_L = len(TUPLE)
-                                        # print(long_L)
                                         if C9 == 0 and (long_L - En) >= 0:
-                                            TUPLE = TUPLE[: long_L - En]
-                                            TUPLE += ZEROS_ONE_1
+                                            TUPLE.truncate(long_L - En)
+                                            TUPLE.write(ZEROS_ONE_1, long_ZEROS_ONE_1)
                                         elif C9 == 1 and (long_L - (En-2)) >= 0:
-                                            TUPLE = TUPLE[: long_L-(En-2)]
-                                            TUPLE += ZEROS_ONE_1
+                                            TUPLE.truncate(long_L - (En-2))
+                                            TUPLE.write(ZEROS_ONE_1, long_ZEROS_ONE_1)
+                                        TUPLE = TUPLE.to_bits()
                                         N3 = 1
                                         # print(N3)
                                         if N3 == 1:
@@ -947,12 +912,7 @@ class compression:
                                                         Z[block : block + TUPLE4], 2
                                                     )
                                                     block += TUPLE4
-                                                    b = 0
-                                                    E3 = ""
-                                                    while b < E5 - 1:
-                                                        E3 += E2
-                                                        b += 1
-                                                        # print(E2)
+                                                    E3 = E2 * (E5 - 1)
                                                     TUPLE1 = TUPLE1[block:]
                                                     E1*=8
                                                     TUPLE1 = (
@@ -1024,6 +984,7 @@ class compression:
                                                     )
                                                     xs = str(xs)
                                                     return xs
-d = compression()
-xw1 = d.cryptograpy_compression4()
-print(xw1)
\ No newline at end of file
+if __name__ == "__main__":
+    d = compression()
+    xw1 = d.cryptograpy_compression4()
+    print(xw1)
\ No newline at end of file
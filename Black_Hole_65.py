@@ -3,6 +3,7 @@ import random
 import struct
 import paq
 import time
+from bh_search import CompressionCache
 
 def reverse_chunks_in_memory(data, chunk_size, positions):
     """Reverses chunks of data in memory."""
@@ -76,6 +77,7 @@ def find_best_chunk_strategy(input_filename, timeout_seconds=60):
         base_name, _ = os.path.splitext(input_filename)
         compressed_filename = base_name + ".compressed.bin"
         chunk_size = 1  # Chunk size is always 1
+        cache = CompressionCache()
         start_time = time.time()
         while time.time() - start_time < timeout_seconds:
             max_positions = file_size // chunk_size
@@ -83,15 +85,20 @@ def find_best_chunk_strategy(input_filename, timeout_seconds=60):
                 positions_count = min(max_positions, 64)
                 #More efficient position calculation
                 positions = sorted(random.sample(range(max_positions), positions_count))
+                key = CompressionCache.key(chunk_size, positions)
+                if cache.get(key) is not None:
+                    continue
                 reversed_data = reverse_chunks_in_memory(original_data, chunk_size, positions)
                 if reversed_data and compress_with_paq(reversed_data, compressed_filename, positions, file_size):
                     compressed_size = os.path.getsize(compressed_filename)
+                    cache.put(key, compressed_size)
                     compression_ratio = compressed_size / file_size
                     if compression_ratio < best_compression_ratio:
                         best_compression_ratio = compression_ratio
                         best_positions = positions
                         print(f"Improved compression: ratio={best_compression_ratio:.4f}")
         print(f"\nBest compression found: ratio={best_compression_ratio:.4f}")
+        cache.report()
         return True
     except Exception as e:
         print(f"Error in find_best_chunk_strategy: {e}")
@@ -1,25 +1,305 @@
-from mpmath import mp
+import os
+import mmap
+import array
+import struct
+import hashlib
+from collections import Counter
+from itertools import accumulate
+from mpmath.libmp import MPZ, isqrt, numeral
 
 # Author: Jurijus Pacalovas
 
+PI_BLOCK_SIZE = 1 << 20  # bytes XORed per step when streaming a file against pi
+
+# Digits of pi are served from the shipped file or the cache, and the cache is extended only past both
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PI_DIGITS_FILE = os.path.join(SCRIPT_DIR, "PI_10M.txt")
+PI_CACHE_FILE = os.path.join(SCRIPT_DIR, "PI_cache.txt")
+PI_STATE_FILE = PI_CACHE_FILE + ".state"  # Chudnovsky series sums, so an extension only adds the new terms
+PI_GUARD_DIGITS = 10
+
+# On-disk k-gram index over a pi digit file: bucket starts for every k-digit string, then the offsets sorted by k-gram
+PI_INDEX_MAGIC = b"BHPIIDX1"
+PI_INDEX_K = 6
+PI_INDEX_HEADER_SIZE = 40  # magic, k, digit count, digest of the digits, padding; the arrays are native uint32
+
+# Offset-search files: magic and block size, then per block the pi offset followed by the XORed bytes
+PI_OFFSET_MAGIC = b"BHPIOFS1"
+PI_SEARCH_BLOCK_SIZE = 4096
+PI_SEARCH_CANDIDATES = 64  # most-voted offsets scored per block
+CHUDNOVSKY_C3_OVER_24 = 640320 ** 3 // 24
+
+# Binary splitting of the Chudnovsky series over the terms a..b-1, returning (P, Q, T)
+def chudnovsky_terms(a, b):
+    if b - a == 1:
+        if a == 0:
+            P = Q = MPZ(1)
+        else:
+            P = MPZ((6 * a - 5) * (2 * a - 1) * (6 * a - 1))
+            Q = MPZ(a * a * a * CHUDNOVSKY_C3_OVER_24)
+        T = P * (13591409 + 545140134 * a)
+        if a & 1:
+            T = -T
+        return P, Q, T
+    m = (a + b) // 2
+    P1, Q1, T1 = chudnovsky_terms(a, m)
+    P2, Q2, T2 = chudnovsky_terms(m, b)
+    return P1 * P2, Q1 * Q2, T1 * Q2 + P1 * T2
+
+# Saved state is the number of terms summed followed by P, Q and T as length-prefixed signed integers
+def load_chudnovsky_state():
+    if not os.path.exists(PI_STATE_FILE):
+        return 0, None, None, None
+    with open(PI_STATE_FILE, 'rb') as file:
+        terms = struct.unpack(">Q", file.read(8))[0]
+        values = []
+        for _ in range(3):
+            length = struct.unpack(">Q", file.read(8))[0]
+            values.append(MPZ(int.from_bytes(file.read(length), 'big', signed=True)))
+    return (terms, *values)
+
+def save_chudnovsky_state(terms, P, Q, T):
+    with open(PI_STATE_FILE + ".tmp", 'wb') as file:
+        file.write(struct.pack(">Q", terms))
+        for value in (P, Q, T):
+            value = int(value)
+            data = value.to_bytes(value.bit_length() // 8 + 1, 'big', signed=True)
+            file.write(struct.pack(">Q", len(data)))
+            file.write(data)
+    os.replace(PI_STATE_FILE + ".tmp", PI_STATE_FILE)
+
+# Extend the cache to at least the requested number of digits, resuming the series from the saved state
+def extend_pi_cache(digits, known_file):
+    terms, P, Q, T = load_chudnovsky_state()
+    needed_terms = (digits + PI_GUARD_DIGITS) // 14 + 2  # each term adds about 14.18 digits
+    if terms < needed_terms:
+        print(f"Computing pi digits with {needed_terms - terms} new series terms...")
+        P2, Q2, T2 = chudnovsky_terms(terms, needed_terms)
+        if terms == 0:
+            P, Q, T = P2, Q2, T2
+        else:
+            P, Q, T = P * P2, Q * Q2, T * Q2 + P * T2
+        terms = needed_terms
+        save_chudnovsky_state(terms, P, Q, T)
+
+    scale = MPZ(10) ** (digits + PI_GUARD_DIGITS)
+    pi_value = Q * 426880 * isqrt(10005 * scale * scale) // T
+    pi_text = numeral(pi_value, size=digits + PI_GUARD_DIGITS + 1)[1:digits + 1]
+
+    if known_file is not None:
+        with PiDigits(known_file) as known_digits:
+            if known_digits.digit_range(0, len(known_digits)) != pi_text[:len(known_digits)].encode('ascii'):
+                raise ValueError(f"{known_file} does not match the computed digits of pi.")
+
+    with open(PI_CACHE_FILE + ".tmp", 'w') as file:
+        file.write(pi_text)
+    os.replace(PI_CACHE_FILE + ".tmp", PI_CACHE_FILE)
+    return pi_text
+
 # Function to generate digits of pi after "3"
 def generate_pi_digits(digits):
     if digits < 1:
         raise ValueError("The number of digits must be at least 1.")
-    mp.dps = digits + 1  # Set the precision
-    pi_value = str(mp.pi)[2:]  # Remove the "3."
-    return pi_value
+    known_files = [name for name in (PI_CACHE_FILE, PI_DIGITS_FILE) if os.path.exists(name)]
+    known_file = max(known_files, key=os.path.getsize, default=None)
+    if known_file is not None:
+        with PiDigits(known_file) as known_digits:
+            if len(known_digits) >= digits:
+                return known_digits.digit_range(0, digits).tobytes().decode('ascii')
+    return extend_pi_cache(digits, known_file)
 
 # Function to compress binary data using pi digits
 def compress_with_pi(data, pi_digits):
-    pi_sequence = [int(d) for d in pi_digits[:len(data)]]
-    compressed_data = bytes([b ^ p for b, p in zip(data, pi_sequence)])
-    return compressed_data
+    if isinstance(pi_digits, str):
+        pi_digits = pi_digits.encode('ascii')
+    length = min(len(data), len(pi_digits))
+    if length == 0:
+        return b""
+    # For the ASCII digits '0'-'9', digit ^ 0x30 is the digit value, so one wide XOR handles the whole block
+    value = int.from_bytes(data[:length], 'big') ^ int.from_bytes(pi_digits[:length], 'big') ^ int.from_bytes(b"0" * length, 'big')
+    return value.to_bytes(length, 'big')
+
+# Digits of pi from a text file, memory-mapped and handed out as views instead of being read into a str
+class PiDigits:
+    def __init__(self, file_name):
+        self.file = open(file_name, 'rb')
+        self.map = None
+        if os.fstat(self.file.fileno()).st_size:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            view = memoryview(self.map)
+        else:
+            view = memoryview(b"")
+        # Same digits as reading the file and calling strip()
+        start, end = 0, len(view)
+        while start < end and chr(view[start]).isspace():
+            start += 1
+        while end > start and chr(view[end - 1]).isspace():
+            end -= 1
+        self.view = view
+        self.digits = view[start:end]
+
+    def __len__(self):
+        return len(self.digits)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def digit_range(self, start, length):
+        return self.digits[start:start + length]
+
+    def xor(self, data, start=0):
+        return compress_with_pi(data, self.digit_range(start, len(data)))
+
+    def close(self):
+        self.digits.release()
+        self.view.release()
+        if self.map is not None:
+            self.map.close()
+        self.file.close()
+
+# XOR a file against pi block by block, so memory use does not grow with the file
+def xor_file_with_pi(input_file, pi_file, output_file):
+    with PiDigits(pi_file) as pi_digits, open(input_file, 'rb') as infile, open(output_file, 'wb') as outfile:
+        offset = 0
+        while offset < len(pi_digits):
+            block = infile.read(min(PI_BLOCK_SIZE, len(pi_digits) - offset))
+            if not block:
+                break
+            outfile.write(pi_digits.xor(block, offset))
+            offset += len(block)
+
+# Memory-mapped k-gram index over a pi digit file, built on first use and rebuilt when the digits change
+class PiIndex:
+    def __init__(self, pi_file, k=PI_INDEX_K):
+        self.k = k
+        self.pi_digits = PiDigits(pi_file)
+        self.digits = self.pi_digits.digits
+        digest = hashlib.blake2b(self.digits, digest_size=16).digest()
+        self.header = PI_INDEX_MAGIC + struct.pack("<IQ", k, len(self.digits)) + digest
+        self.header += bytes(PI_INDEX_HEADER_SIZE - len(self.header))
+        self.index_file = f"{pi_file}.k{k}.idx"
+        if not self.is_current():
+            self.build()
+        self.file = open(self.index_file, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        table = memoryview(self.map)[PI_INDEX_HEADER_SIZE:].cast('I')
+        self.starts = table[:10 ** k + 1]
+        self.positions = table[10 ** k + 1:]
+
+    def is_current(self):
+        if not os.path.exists(self.index_file):
+            return False
+        with open(self.index_file, 'rb') as file:
+            return file.read(PI_INDEX_HEADER_SIZE) == self.header
+
+    def build(self):
+        print(f"Building pi index {self.index_file}...")
+        digits = self.digits.tobytes()
+        keys = [int(digits[i:i + self.k]) for i in range(len(digits) - self.k + 1)]
+        counts = [0] * (10 ** self.k + 1)
+        for key in keys:
+            counts[key + 1] += 1
+        # sorted() is stable, so offsets stay ascending inside each bucket
+        positions = sorted(range(len(keys)), key=keys.__getitem__)
+        with open(self.index_file + ".tmp", 'wb') as file:
+            file.write(self.header)
+            array.array('I', accumulate(counts)).tofile(file)
+            array.array('I', positions).tofile(file)
+        os.replace(self.index_file + ".tmp", self.index_file)
+
+    # All offsets where the digit string occurs, in ascending order
+    def find(self, pattern):
+        if isinstance(pattern, str):
+            pattern = pattern.encode('ascii')
+        length = len(pattern)
+        if length == 0 or not pattern.isdigit() or length > len(self.digits):
+            return []
+        if length >= self.k:
+            key = int(pattern[:self.k])
+            return [position for position in self.positions[self.starts[key]:self.starts[key + 1]]
+                    if self.digits[position:position + length] == pattern]
+        # A short pattern is the prefix of a contiguous range of k-grams; the last k - 1 offsets have no k-gram
+        span = 10 ** (self.k - length)
+        key = int(pattern) * span
+        offsets = list(self.positions[self.starts[key]:self.starts[key + span]])
+        for position in range(max(len(self.digits) - self.k + 1, 0), len(self.digits) - length + 1):
+            if self.digits[position:position + length] == pattern:
+                offsets.append(position)
+        return sorted(offsets)
+
+_pi_indexes = {}
+
+def load_pi_index(pi_file=PI_DIGITS_FILE):
+    if pi_file not in _pi_indexes:
+        _pi_indexes[pi_file] = PiIndex(pi_file)
+    return _pi_indexes[pi_file]
+
+# Offsets in the pi digit file where the given digit string starts
+def find_in_pi(digits, pi_file=PI_DIGITS_FILE):
+    return load_pi_index(pi_file).find(digits)
 
-# Function to extract binary data using pi digits
-def extract_with_pi(data, pi_digits):
-    # Reverse the compression process
-    return compress_with_pi(data, pi_digits)
+# Low nibbles as ASCII digits ('x' where the nibble is above 9), and the high nibbles kept in place
+LOW_NIBBLE_DIGITS = bytes(48 + (b & 0x0F) if b & 0x0F < 10 else ord('x') for b in range(256))
+HIGH_NIBBLES = bytes(b & 0xF0 for b in range(256))
+
+# Pick the pi offset whose digits equal the low nibbles of the block at the most positions
+def best_pi_offset(block, index, default_offset):
+    low_digits = block.translate(LOW_NIBBLE_DIGITS)
+    high = int.from_bytes(block.translate(HIGH_NIBBLES), 'big')
+
+    def matches(offset):
+        xored = int.from_bytes(index.pi_digits.xor(block, offset), 'big')
+        return (xored ^ high).to_bytes(len(block), 'big').count(0)
+
+    votes = Counter()
+    for start in range(0, len(block) - index.k + 1, index.k):
+        window = low_digits[start:start + index.k]
+        if window.isdigit():
+            for position in index.find(window):
+                if start <= position <= len(index.digits) - len(block) + start:
+                    votes[position - start] += 1
+
+    best_offset, best_matches = default_offset, matches(default_offset)
+    for offset, _ in votes.most_common(PI_SEARCH_CANDIDATES):
+        offset_matches = matches(offset)
+        if offset_matches > best_matches:
+            best_offset, best_matches = offset, offset_matches
+    return best_offset
+
+# XOR each block against pi from its best offset, so the input is no longer limited to the number of digits
+def xor_file_with_pi_search(input_file, pi_file, output_file, block_size=PI_SEARCH_BLOCK_SIZE):
+    index = load_pi_index(pi_file)
+    if len(index.digits) < block_size:
+        raise ValueError(f"{pi_file} holds fewer than {block_size} digits.")
+    with open(input_file, 'rb') as infile, open(output_file, 'wb') as outfile:
+        outfile.write(PI_OFFSET_MAGIC + struct.pack(">I", block_size))
+        position = 0
+        while True:
+            block = infile.read(block_size)
+            if not block:
+                break
+            default_offset = position if position + len(block) <= len(index.digits) else 0
+            offset = best_pi_offset(block, index, default_offset)
+            outfile.write(struct.pack(">I", offset) + index.pi_digits.xor(block, offset))
+            position += len(block)
+
+def is_pi_offset_file(file_name):
+    with open(file_name, 'rb') as file:
+        return file.read(len(PI_OFFSET_MAGIC)) == PI_OFFSET_MAGIC
+
+def restore_file_with_pi_search(input_file, pi_file, output_file):
+    with PiDigits(pi_file) as pi_digits, open(input_file, 'rb') as infile, open(output_file, 'wb') as outfile:
+        infile.read(len(PI_OFFSET_MAGIC))
+        block_size = struct.unpack(">I", infile.read(4))[0]
+        while True:
+            record = infile.read(4 + block_size)
+            if not record:
+                break
+            offset = struct.unpack(">I", record[:4])[0]
+            outfile.write(pi_digits.xor(record[4:], offset))
 
 # Function to generate and save digits of pi to a file
 def generate_pi_and_save(digits, file_name):
@@ -35,8 +315,10 @@ while True:
     print("2. Extract using Pi")
     print("3. Generate and Save Pi Digits")
     print("4. Quit")
+    print("5. Compress using Pi with offset search")
+    print("6. Find digits in Pi")
 
-    choice = input("Enter your choice (1/2/3/4): ")
+    choice = input("Enter your choice (1/2/3/4/5/6): ")
 
     if choice == '1':
         # Compression
@@ -45,20 +327,8 @@ while True:
             pi_file = input("Enter the file name that contains pi digits: ")
             output_file = input("Enter the output file for saving compressed data: ")
 
-            # Read binary data from the input file
-            with open(input_file, 'rb') as file:
-                binary_data = file.read()
-
-            # Read pi digits from the pi file
-            with open(pi_file, 'r') as file:
-                pi_digits = file.read().strip()
-
-            # Compress the binary data using digits of pi
-            compressed_data = compress_with_pi(binary_data, pi_digits)
-
-            # Save the compressed data to the specified output file
-            with open(output_file, 'wb') as file:
-                file.write(compressed_data)
+            # Compress the binary data using digits of pi and save it to the specified output file
+            xor_file_with_pi(input_file, pi_file, output_file)
 
             print(f"Compression complete. Saved to {output_file}.")
         except Exception as e:
@@ -71,20 +341,11 @@ while True:
             pi_file = input("Enter the file name that contains pi digits: ")
             output_file = input("Enter the output file for saving extracted data: ")
 
-            # Read the compressed data from the input file
-            with open(input_file, 'rb') as file:
-                compressed_data = file.read()
-
-            # Read pi digits from the pi file
-            with open(pi_file, 'r') as file:
-                pi_digits = file.read().strip()
-
-            # Extract the data using digits of pi
-            extracted_data = extract_with_pi(compressed_data, pi_digits)
-
-            # Save the extracted data to the specified output file
-            with open(output_file, 'wb') as file:
-                file.write(extracted_data)
+            # Extract the data using digits of pi and save it to the specified output file
+            if is_pi_offset_file(input_file):
+                restore_file_with_pi_search(input_file, pi_file, output_file)
+            else:
+                xor_file_with_pi(input_file, pi_file, output_file)
 
             print(f"Extraction complete. Saved to {output_file}.")
         except Exception as e:
@@ -105,5 +366,26 @@ while True:
         print("Exiting the program.")
         break
     
+    elif choice == '5':
+        # Compression with a pi offset chosen per block
+        try:
+            input_file = input("Enter the input file name for compression: ")
+            pi_file = input("Enter the file name that contains pi digits: ")
+            output_file = input("Enter the output file for saving compressed data: ")
+            xor_file_with_pi_search(input_file, pi_file, output_file)
+            print(f"Compression complete. Saved to {output_file}.")
+        except Exception as e:
+            print(f"Error: {e}")
+
+    elif choice == '6':
+        # Look up a digit string in the pi index
+        try:
+            pi_file = input("Enter the file name that contains pi digits: ")
+            digits = input("Enter the digits to find: ").strip()
+            offsets = find_in_pi(digits, pi_file)
+            print(f"Found {len(offsets)} times. First offsets: {offsets[:20]}")
+        except Exception as e:
+            print(f"Error: {e}")
+
     else:
-        print("Invalid choice. Please enter 1, 2, 3, or 4.")
\ No newline at end of file
+        print("Invalid choice. Please enter 1, 2, 3, 4, 5, or 6.")
\ No newline at end of file
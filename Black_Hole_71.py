@@ -3,6 +3,7 @@ import random
 import struct
 import paq
 import time
+from bh_search import ChunkReverser, CompressionCache
 
 def manage_leading_zeros(input_data):
     """Strips leading zeros from byte data."""
@@ -53,6 +54,7 @@ def find_best_chunk_strategy(input_filename, max_consecutive_no_improvements=360
     best_chunk_size = 1
     best_positions = []
     consecutive_no_improvements = 0
+    cache = CompressionCache()
     start_time = time.time()
 
     try:
@@ -62,6 +64,7 @@ def find_best_chunk_strategy(input_filename, max_consecutive_no_improvements=360
         print(f"Error: Input file '{input_filename}' not found.")
         return
 
+    reverser = ChunkReverser(file_data)
     iteration = 0
     while consecutive_no_improvements < max_consecutive_no_improvements and time.time() - start_time < max_time_seconds:
         iteration += 1
@@ -69,8 +72,13 @@ def find_best_chunk_strategy(input_filename, max_consecutive_no_improvements=360
         max_positions = file_size // chunk_size
         num_positions = random.randint(0, min(max_positions, 64))
         positions = sorted(random.sample(range(max_positions), num_positions)) if num_positions > 0 else []
-        reversed_data = reverse_chunks_at_positions(file_data, chunk_size, positions)
+        key = CompressionCache.key(chunk_size, positions)
+        if cache.get(key) is not None:
+            consecutive_no_improvements += 1  # Already evaluated, so it cannot improve the best
+            continue
+        reversed_data = reverser.apply(chunk_size, positions)
         compressed_data = compress_with_paq(reversed_data, chunk_size, positions, file_size)
+        cache.put(key, len(compressed_data))
         compression_ratio = len(compressed_data) / file_size
 
         if compression_ratio < best_compression_ratio:
@@ -89,6 +97,7 @@ def find_best_chunk_strategy(input_filename, max_consecutive_no_improvements=360
     print(f"Chunk size: {best_chunk_size}")
     print(f"Positions: {best_positions}")
     print(f"Time taken: {elapsed_time:.2f} seconds")
+    cache.report()
 
     # Save only .compressed.bin
     compressed_filename = f"{input_filename}.compressed.bin"
@@ -3,6 +3,7 @@ import random
 import struct
 import paq
 import time
+from bh_search import ChunkReverser, CompressionCache
 
 def manage_leading_zeros(input_data):
     """Strips leading zeros from byte data."""
@@ -61,6 +62,8 @@ def find_best_chunk_strategy(input_filename, max_consecutive_no_improvements=360
     best_chunk_size = 1
     best_positions = []
     consecutive_no_improvements = 0
+    cache = CompressionCache()
+    reverser = ChunkReverser(file_data)
     start_time = time.time()
 
     iteration = 0
@@ -70,9 +73,14 @@ def find_best_chunk_strategy(input_filename, max_consecutive_no_improvements=360
         max_positions = file_size // chunk_size
         num_positions = random.randint(0, min(max_positions, 64)) # Limit number of positions
         positions = sorted(random.sample(range(max_positions), num_positions)) if num_positions > 0 else []
+        key = CompressionCache.key(chunk_size, positions)
+        if cache.get(key) is not None:
+            consecutive_no_improvements += 1  # Already evaluated, so it cannot improve the best
+            continue
 
-        reversed_data = reverse_chunks_at_positions(file_data, chunk_size, positions)
+        reversed_data = reverser.apply(chunk_size, positions)
         compressed_data = compress_with_paq(reversed_data, chunk_size, positions, file_size)
+        cache.put(key, len(compressed_data))
         compression_ratio = len(compressed_data) / file_size # CORRECTED: No arbitrary subtraction
 
         if compression_ratio < best_compression_ratio:
@@ -91,6 +99,7 @@ def find_best_chunk_strategy(input_filename, max_consecutive_no_improvements=360
     print(f"Chunk size: {best_chunk_size}")
     print(f"Positions: {best_positions}")
     print(f"Time taken: {elapsed_time:.2f} seconds")
+    cache.report()
 
     compressed_filename = f"{input_filename}.compressed.bin"
     try:
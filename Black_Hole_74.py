@@ -1,8 +1,63 @@
 import os
+import bz2
+import lzma
 import random
 import struct
+import zlib
+from collections import OrderedDict, deque, namedtuple
+from contextlib import nullcontext
 import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from multiprocessing import shared_memory
 import paq
+from bh_search import ChunkReverser, CompressionCache
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # zstd is optional; the other codecs are always available
+
+# Single-stream file: CODEC_MAGIC, the codec id byte, then one
+# compress_with_codec payload. Files without CODEC_MAGIC are a bare paq payload.
+CODEC_MAGIC = b"BH74CDC1"
+
+# Segmented container (--segment-mb): SEGMENT_MAGIC and the segment size, then
+# per segment its codec id byte and compress_with_codec payload, an index entry
+# per segment, then the trailer and SEGMENT_MAGIC again. PAQ_SEGMENT_MAGIC marks
+# the earlier layout whose segments are bare paq payloads.
+SEGMENT_MAGIC = b"BH74SEG2"
+PAQ_SEGMENT_MAGIC = b"BH74SEG1"
+SEGMENT_HEADER = struct.Struct(">I")  # Segment size in bytes
+SEGMENT_INDEX_ENTRY = struct.Struct(">QII")  # Payload offset (codec id byte included), payload length, original length
+SEGMENT_TRAILER = struct.Struct(">QI")  # Index offset, segment count
+
+# Backends the reversal search can target, by name. The id is written into
+# archives, so an id must never be reused for a different codec.
+Codec = namedtuple("Codec", "name id compress decompress")
+CODECS = OrderedDict()
+
+def register_codec(name, codec_id, compress, decompress):
+    """Makes a compress(bytes)/decompress(bytes) backend available to the search."""
+    CODECS[name] = Codec(name, codec_id, compress, decompress)
+
+def codec_by_id(codec_id):
+    """Returns the registered codec with the given archive id."""
+    for codec in CODECS.values():
+        if codec.id == codec_id:
+            return codec
+    raise ValueError(f"Codec id {codec_id} is not available (is its module installed?)")
+
+register_codec("paq", 0, paq.compress, paq.decompress)
+register_codec("zlib", 1, lambda data: zlib.compress(data, 9), zlib.decompress)
+register_codec("bz2", 2, lambda data: bz2.compress(data, 9), bz2.decompress)
+register_codec("lzma", 3, lambda data: lzma.compress(data, preset=9), lzma.decompress)
+if zstandard is not None:
+    register_codec("zstd", 4, zstandard.ZstdCompressor(level=19).compress, zstandard.ZstdDecompressor().decompress)
+
+DECOMPRESSION_ERRORS = (OSError, ValueError, struct.error, zlib.error, lzma.LZMAError, paq.PAQError)
+if zstandard is not None:
+    DECOMPRESSION_ERRORS += (zstandard.ZstdError,)
 
 def manage_leading_zeros(input_data):
     """Strips leading zeros from byte data."""
@@ -21,103 +76,425 @@ def reverse_chunks_at_positions(input_data, chunk_size, positions):
             chunked_data[pos] = chunked_data[pos][::-1]
     return b"".join(chunked_data)
 
-def compress_with_paq(data, chunk_size, positions, original_size):
-    """Compresses data using PAQ and embeds metadata."""
+def compress_with_codec(data, chunk_size, positions, original_size, codec_name="paq"):
+    """Compresses data with the named codec and embeds metadata."""
     # More efficient metadata encoding (example - consider more advanced methods)
     metadata = struct.pack(">I", original_size) + struct.pack(">I", chunk_size) + \
                struct.pack(">B", len(positions)) + struct.pack(f">{len(positions)}I", *positions)
-    compressed_data = paq.compress(metadata + data)
+    compressed_data = CODECS[codec_name].compress(metadata + data)
     return compressed_data
 
-def decompress_and_restore_paq(compressed_filename):
+def restore_payload(compressed_data, codec_id):
+    """Decompresses one compress_with_codec payload and undoes its chunk reversals."""
+    decompressed_data = codec_by_id(codec_id).decompress(compressed_data)
+    original_size = struct.unpack(">I", decompressed_data[:4])[0]
+    chunk_size = struct.unpack(">I", decompressed_data[4:8])[0]
+    num_positions = struct.unpack(">B", decompressed_data[8:9])[0] # Changed to unsigned byte
+    positions = struct.unpack(f">{num_positions}I", decompressed_data[9:9 + num_positions * 4])
+    restored_data = reverse_chunks_at_positions(decompressed_data[9 + num_positions * 4:], chunk_size, positions)
+    return restored_data[:original_size]
+
+def restore_single_stream(file_data):
+    """Restores a single-stream file, with or without the codec header."""
+    if file_data.startswith(CODEC_MAGIC):
+        if len(file_data) <= len(CODEC_MAGIC):
+            raise ValueError("single-stream file is truncated (no codec id)")
+        return restore_payload(file_data[len(CODEC_MAGIC) + 1:], file_data[len(CODEC_MAGIC)])
+    return restore_payload(file_data, CODECS["paq"].id)
+
+def is_segmented(compressed_filename):
+    """Tells whether a .compressed.bin file is a segmented container."""
+    with open(compressed_filename, 'rb') as infile:
+        return infile.read(len(SEGMENT_MAGIC)) in (SEGMENT_MAGIC, PAQ_SEGMENT_MAGIC)
+
+def read_segment_index(infile):
+    """Returns the index entries of a segmented container and whether its segments carry codec ids."""
+    infile.seek(0)
+    magic = infile.read(len(SEGMENT_MAGIC))
+    infile.seek(-(SEGMENT_TRAILER.size + len(magic)), os.SEEK_END)
+    trailer = infile.read(SEGMENT_TRAILER.size + len(magic))
+    if trailer[SEGMENT_TRAILER.size:] != magic:
+        raise ValueError("segmented container is truncated (no trailer)")
+    index_offset, segment_count = SEGMENT_TRAILER.unpack(trailer[:SEGMENT_TRAILER.size])
+    infile.seek(index_offset)
+    index_data = infile.read(segment_count * SEGMENT_INDEX_ENTRY.size)
+    return list(SEGMENT_INDEX_ENTRY.iter_unpack(index_data)), magic == SEGMENT_MAGIC
+
+def read_segment_payload(infile, payload_offset, payload_length, has_codec_id):
+    """Returns the (payload, codec id) of one segment; segments without an id are paq."""
+    infile.seek(payload_offset)
+    if not has_codec_id:
+        return infile.read(payload_length), CODECS["paq"].id
+    codec_byte = infile.read(1)
+    if not codec_byte:
+        raise ValueError("segmented container is truncated (no codec id)")
+    return infile.read(payload_length - 1), codec_byte[0]
+
+def map_in_order(executor, function, argument_tuples, window):
+    """Yields function(*arguments) in order, keeping at most window tasks in the executor.
+
+    Without an executor the calls run one at a time in this process.
+    """
+    if executor is None:
+        for arguments in argument_tuples:
+            yield function(*arguments)
+        return
+    pending = deque()
+    for arguments in argument_tuples:
+        pending.append(executor.submit(function, *arguments))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+def segment_pool(workers):
+    """A process pool for per-segment work, or a stand-in for None when workers is 1."""
+    return ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext()
+
+def extract_segmented(compressed_filename, restored_filename, workers=1):
+    """Restores a segmented container in order; returns the restored size.
+
+    Segments are decompressed on up to workers processes, with at most two per
+    worker read ahead of the one being written.
+    """
+    restored_size = 0
+    with open(compressed_filename, 'rb') as infile, open(restored_filename, 'wb') as outfile:
+        index, has_codec_id = read_segment_index(infile)
+
+        def payloads():
+            for offset, length, _ in index:
+                yield read_segment_payload(infile, offset, length, has_codec_id)
+
+        with segment_pool(workers) as executor:
+            restored_segments = map_in_order(executor, restore_payload, payloads(), workers * 2)
+            for number, (restored_data, (_, _, original_length)) in enumerate(zip(restored_segments, index), 1):
+                if len(restored_data) != original_length:
+                    raise ValueError(f"segment {number} restored to {len(restored_data)} bytes, expected {original_length}")
+                outfile.write(restored_data)
+                restored_size += original_length
+    return restored_size
+
+def extract_range(compressed_filename, offset, length):
+    """Returns up to length bytes of the original file, starting at offset.
+
+    For a segmented container only the segments that overlap the range are
+    read, decompressed and un-reversed. A single-stream file has to be
+    restored whole.
+    """
+    if offset < 0 or length < 0:
+        raise ValueError("offset and length must not be negative")
+    if not is_segmented(compressed_filename):
+        with open(compressed_filename, 'rb') as infile:
+            return restore_single_stream(infile.read())[offset:offset + length]
+
+    end = offset + length
+    pieces = []
+    with open(compressed_filename, 'rb') as infile:
+        index, has_codec_id = read_segment_index(infile)
+        segment_start = 0
+        for payload_offset, payload_length, original_length in index:
+            if segment_start >= end:
+                break
+            segment_end = segment_start + original_length
+            if offset < segment_end:
+                restored_data = restore_payload(*read_segment_payload(infile, payload_offset, payload_length, has_codec_id))
+                pieces.append(restored_data[max(offset - segment_start, 0):end - segment_start])
+            segment_start = segment_end
+    return b"".join(pieces)
+
+def decompress_and_restore_paq(compressed_filename, workers=1):
     """Decompresses and restores data from a compressed file."""
     try:
-        with open(compressed_filename, 'rb') as infile:
-            compressed_data = infile.read()
-        decompressed_data = paq.decompress(compressed_data)
-        original_size = struct.unpack(">I", decompressed_data[:4])[0]
-        chunk_size = struct.unpack(">I", decompressed_data[4:8])[0]
-        num_positions = struct.unpack(">B", decompressed_data[8:9])[0] # Changed to unsigned byte
-        positions = struct.unpack(f">{num_positions}I", decompressed_data[9:9 + num_positions * 4])
-        restored_data = reverse_chunks_at_positions(decompressed_data[9 + num_positions * 4:], chunk_size, positions)
-        restored_data = restored_data[:original_size]
         restored_filename = compressed_filename.replace('.compressed.bin', '')
-        with open(restored_filename, 'wb') as outfile:
-            outfile.write(restored_data)
-        print(f"Decompression complete. Restored file size: {len(restored_data)} bytes")
-    except (FileNotFoundError, paq.PAQError, struct.error) as e:
+        if is_segmented(compressed_filename):
+            restored_size = extract_segmented(compressed_filename, restored_filename, workers)
+        else:
+            with open(compressed_filename, 'rb') as infile:
+                compressed_data = infile.read()
+            restored_data = restore_single_stream(compressed_data)
+            with open(restored_filename, 'wb') as outfile:
+                outfile.write(restored_data)
+            restored_size = len(restored_data)
+        print(f"Decompression complete. Restored file size: {restored_size} bytes")
+    except DECOMPRESSION_ERRORS as e:
         print(f"Decompression failed: {e}")
 
-def find_best_chunk_strategy(input_filename, max_time_seconds):
-    """Finds the best chunk size and reversal positions for compression."""
-    try:
-        with open(input_filename, 'rb') as infile:
-            file_data = infile.read()
-            file_size = len(file_data)
-    except FileNotFoundError:
-        print(f"Error: Input file '{input_filename}' not found.")
-        return
+class SharedInput:
+    """The input file bytes copied once into shared memory for the search workers."""
+
+    def __init__(self, file_data):
+        self.size = len(file_data)
+        self.shm = shared_memory.SharedMemory(create=True, size=max(self.size, 1))
+        self.shm.buf[:self.size] = file_data
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
 
+# Set once per worker process by init_worker. Workers read the file through
+# a view of the parent's shared memory rather than a pickled copy, and keep
+# one ChunkReverser over it for every candidate.
+worker_shm = None
+worker_file_data = None
+worker_reverser = None
+worker_codec_name = None
+
+def init_worker(shm_name, file_size, codec_name):
+    """Attaches the worker process to the shared input file bytes."""
+    global worker_shm, worker_file_data, worker_reverser, worker_codec_name
+    worker_codec_name = codec_name
+    worker_shm = shared_memory.SharedMemory(name=shm_name)
+    worker_file_data = worker_shm.buf[:file_size]
+    worker_reverser = ChunkReverser(worker_file_data)
+
+def random_candidate(file_size):
+    """Draws a random (chunk_size, positions) candidate for the search."""
+    chunk_size = random.randint(1, min(256, file_size))  # Cap chunk size to file size
+    max_positions = file_size // chunk_size
+    num_positions = random.randint(0, min(max_positions, 64))  # Limit number of positions
+    positions = sorted(random.sample(range(max_positions), num_positions)) if num_positions > 0 else []
+    return chunk_size, positions
+
+def evaluate_candidate(chunk_size, positions):
+    """Returns the compressed size of the worker's file data for one candidate."""
+    reversed_data = worker_reverser.apply(chunk_size, positions)
+    compressed_data = compress_with_codec(reversed_data, chunk_size, positions, len(worker_file_data), worker_codec_name)
+    return len(compressed_data), chunk_size, positions
+
+def search_serial(file_data, max_time_seconds, verbose=True, codec_name="paq"):
+    """Evaluates candidates one at a time in this process."""
+    file_size = len(file_data)
     best_compression_ratio = float('inf')
     best_chunk_size = 1
     best_positions = []
+    cache = CompressionCache()
+    reverser = ChunkReverser(file_data)
     start_time = time.time()
 
     iteration = 0
     while time.time() - start_time < max_time_seconds:
         iteration += 1
-        chunk_size = random.randint(1, min(256, file_size))  # Cap chunk size to file size
-        max_positions = file_size // chunk_size
-        num_positions = random.randint(0, min(max_positions, 64))  # Limit number of positions
-        positions = sorted(random.sample(range(max_positions), num_positions)) if num_positions > 0 else []
+        chunk_size, positions = random_candidate(file_size)
+        key = CompressionCache.key(chunk_size, positions)
+        if cache.get(key) is not None:
+            continue
 
-        reversed_data = reverse_chunks_at_positions(file_data, chunk_size, positions)
-        compressed_data = compress_with_paq(reversed_data, chunk_size, positions, file_size)
+        reversed_data = reverser.apply(chunk_size, positions)
+        compressed_data = compress_with_codec(reversed_data, chunk_size, positions, file_size, codec_name)
+        cache.put(key, len(compressed_data))
         compression_ratio = len(compressed_data) / file_size
 
         if compression_ratio < best_compression_ratio:
             best_compression_ratio = compression_ratio
             best_chunk_size = chunk_size
             best_positions = positions
-            print(f"Improved compression: {len(compressed_data)} bytes (chunk size: {chunk_size}, positions: {positions})")
+            if verbose:
+                print(f"Improved compression: {len(compressed_data)} bytes (chunk size: {chunk_size}, positions: {positions})")
+
+    if verbose:
+        cache.report()
+    return best_compression_ratio, best_chunk_size, best_positions, iteration
+
+def search_parallel(file_data, max_time_seconds, workers, codec_name="paq"):
+    """Evaluates candidates in a process pool, keeping the global best in the parent."""
+    file_size = len(file_data)
+    best_compression_ratio = float('inf')
+    best_chunk_size = 1
+    best_positions = []
+    cache = CompressionCache()
+    start_time = time.time()
+    iteration = 0
+
+    def submit_uncached(executor, pending):
+        # Cache hits are counted as iterations but never reach a worker.
+        nonlocal iteration
+        while time.time() - start_time < max_time_seconds:
+            iteration += 1
+            chunk_size, positions = random_candidate(file_size)
+            if cache.get(CompressionCache.key(chunk_size, positions)) is None:
+                pending.add(executor.submit(evaluate_candidate, chunk_size, positions))
+                return
+
+    shared_input = SharedInput(file_data)
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                                 initargs=(shared_input.shm.name, file_size, codec_name)) as executor:
+            # Keep two candidates queued per worker so no core idles between results.
+            pending = set()
+            for _ in range(workers * 2):
+                submit_uncached(executor, pending)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    compressed_size, chunk_size, positions = future.result()
+                    cache.put(CompressionCache.key(chunk_size, positions), compressed_size)
+                    compression_ratio = compressed_size / file_size
+
+                    if compression_ratio < best_compression_ratio:
+                        best_compression_ratio = compression_ratio
+                        best_chunk_size = chunk_size
+                        best_positions = positions
+                        print(f"Improved compression: {compressed_size} bytes (chunk size: {chunk_size}, positions: {positions})")
+
+                    submit_uncached(executor, pending)
+    finally:
+        shared_input.close()
+
+    cache.report()
+    return best_compression_ratio, best_chunk_size, best_positions, iteration
+
+def search_codecs(file_data, max_time_seconds, workers, codec_name, verbose=True):
+    """Runs the search against one codec, or against every codec for "mixed".
+
+    "mixed" splits the time limit evenly between the registered codecs and keeps
+    whichever gives the smallest result. Returns the codec name, compression
+    ratio, chunk size, positions and total iterations.
+    """
+    codec_names = list(CODECS) if codec_name == "mixed" else [codec_name]
+    codec_time = max_time_seconds / len(codec_names)
+    best = None
+    total_iterations = 0
+    for name in codec_names:
+        if verbose and len(codec_names) > 1:
+            print(f"Searching with {name}...")
+        if workers > 1:
+            ratio, chunk_size, positions, iterations = search_parallel(file_data, codec_time, workers, name)
+        else:
+            ratio, chunk_size, positions, iterations = search_serial(file_data, codec_time, verbose, name)
+        total_iterations += iterations
+        if best is None or ratio < best[1]:
+            best = (name, ratio, chunk_size, positions)
+    return best + (total_iterations,)
+
+def find_best_chunk_strategy(input_filename, max_time_seconds, workers=1, codec_name="paq"):
+    """Finds the best chunk size and reversal positions for compression."""
+    try:
+        with open(input_filename, 'rb') as infile:
+            file_data = infile.read()
+            file_size = len(file_data)
+    except FileNotFoundError:
+        print(f"Error: Input file '{input_filename}' not found.")
+        return
+
+    start_time = time.time()
+    best_codec_name, best_compression_ratio, best_chunk_size, best_positions, iteration = search_codecs(file_data, max_time_seconds, workers, codec_name)
 
     elapsed_time = time.time() - start_time
     print(f"\nBest compression achieved after {iteration} iterations (time limit: {max_time_seconds} seconds):")
+    print(f"Codec: {best_codec_name}")
     print(f"Compression ratio: {best_compression_ratio:.4f}")
     print(f"Chunk size: {best_chunk_size}")
     print(f"Positions: {best_positions}")
     print(f"Time taken: {elapsed_time:.2f} seconds")
+    print(f"Iterations per second: {iteration / elapsed_time:.2f} ({workers} worker(s))")
 
     compressed_filename = f"{input_filename}.compressed.bin"
     try:
         with open(compressed_filename, 'wb') as outfile:
-            compressed_data = compress_with_paq(reverse_chunks_at_positions(file_data, best_chunk_size, best_positions), best_chunk_size, best_positions, file_size)
+            compressed_data = compress_with_codec(reverse_chunks_at_positions(file_data, best_chunk_size, best_positions), best_chunk_size, best_positions, file_size, best_codec_name)
+            outfile.write(CODEC_MAGIC + bytes([CODECS[best_codec_name].id]))
             outfile.write(compressed_data)
         print(f"Compressed file saved as {compressed_filename}")
     except Exception as e:
         print(f"Error writing compressed file: {e}")
 
+def compress_segment(segment, max_time_seconds, codec_name, verbose=True):
+    """Searches one segment and returns its payload, codec name, chunk size and number of positions."""
+    codec_name, _, chunk_size, positions, _ = search_codecs(segment, max_time_seconds, 1, codec_name, verbose)
+    payload = compress_with_codec(reverse_chunks_at_positions(segment, chunk_size, positions), chunk_size, positions, len(segment), codec_name)
+    return payload, codec_name, chunk_size, len(positions)
+
+def compress_segmented(input_filename, max_time_seconds, workers, segment_size, codec_name="paq"):
+    """Searches and compresses the file segment by segment into a segmented container.
+
+    Each segment gets a share of the time limit proportional to its size. With
+    workers > 1 whole segments are searched and compressed concurrently, one
+    per process, and at most two per worker are held in memory at a time.
+    """
+    try:
+        file_size = os.path.getsize(input_filename)
+    except FileNotFoundError:
+        print(f"Error: Input file '{input_filename}' not found.")
+        return
+
+    compressed_filename = f"{input_filename}.compressed.bin"
+    start_time = time.time()
+    index = []
+    with open(input_filename, 'rb') as infile, open(compressed_filename, 'wb') as outfile:
+        outfile.write(SEGMENT_MAGIC + SEGMENT_HEADER.pack(segment_size))
+        segment_lengths = deque()
+
+        def segments():
+            for segment in iter(lambda: infile.read(segment_size), b""):
+                segment_lengths.append(len(segment))
+                yield segment, max_time_seconds * len(segment) / file_size, codec_name, workers == 1
+
+        with segment_pool(workers) as executor:
+            for payload, segment_codec_name, chunk_size, num_positions in map_in_order(executor, compress_segment, segments(), workers * 2):
+                original_length = segment_lengths.popleft()
+                index.append((outfile.tell(), len(payload) + 1, original_length))
+                outfile.write(bytes([CODECS[segment_codec_name].id]))
+                outfile.write(payload)
+                print(f"Segment {len(index)}: {original_length} -> {len(payload)} bytes "
+                      f"(codec: {segment_codec_name}, chunk size: {chunk_size}, positions: {num_positions})")
+
+        index_offset = outfile.tell()
+        for entry in index:
+            outfile.write(SEGMENT_INDEX_ENTRY.pack(*entry))
+        outfile.write(SEGMENT_TRAILER.pack(index_offset, len(index)) + SEGMENT_MAGIC)
+        compressed_size = outfile.tell()
+
+    print(f"\nCompressed {file_size} bytes in {len(index)} segment(s) to {compressed_size} bytes "
+          f"in {time.time() - start_time:.2f} seconds")
+    print(f"Compressed file saved as {compressed_filename}")
+
 def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=1,
+                        help="number of processes for the compression search, or for whole segments with --segment-mb "
+                             "and when extracting a segmented file (default: 1)")
+    parser.add_argument("--codec", choices=list(CODECS) + ["mixed"], default="paq",
+                        help="compressor the reversal search targets; mixed tries each and keeps the smallest (default: paq)")
+    parser.add_argument("--segment-mb", type=int, default=0,
+                        help="compress in independent segments of this many MiB, holding a few at a time in memory (default: 0, a single stream)")
+    args = parser.parse_args()
+
     print("Created by Jurijus Pacalovas.")
 
     while True:
         try:
-            mode = int(input("Enter mode (1 for compress, 2 for extract): "))
-            if mode not in [1, 2]:
-                print("Error: Please enter 1 for compress or 2 for extract.")
+            mode = int(input("Enter mode (1 for compress, 2 for extract, 3 for extract a byte range): "))
+            if mode not in [1, 2, 3]:
+                print("Error: Please enter 1 for compress, 2 for extract or 3 for extract a byte range.")
             else:
                 break
         except ValueError:
-            print("Error: Invalid input. Please enter a number (1 or 2).")
+            print("Error: Invalid input. Please enter a number (1, 2 or 3).")
 
     if mode == 1:
         input_filename = input("Enter input file name to compress: ")
         max_time_seconds = int(input("Enter maximum time limit for compression (in seconds): "))
-        find_best_chunk_strategy(input_filename, max_time_seconds)
+        if args.segment_mb > 0:
+            compress_segmented(input_filename, max_time_seconds, args.workers, args.segment_mb * 1024 * 1024, args.codec)
+        else:
+            find_best_chunk_strategy(input_filename, max_time_seconds, args.workers, args.codec)
     elif mode == 2:
         compressed_filename_base = input("Enter the base name of the compressed file to extract (without .compressed.bin): ")
         compressed_filename = f"{compressed_filename_base}.compressed.bin"
-        decompress_and_restore_paq(compressed_filename)
+        decompress_and_restore_paq(compressed_filename, args.workers)
+    elif mode == 3:
+        compressed_filename_base = input("Enter the base name of the compressed file to extract from (without .compressed.bin): ")
+        compressed_filename = f"{compressed_filename_base}.compressed.bin"
+        offset = int(input("Enter the offset of the first byte to extract: "))
+        length = int(input("Enter the number of bytes to extract: "))
+        range_filename = input("Enter the output file name for the range: ")
+        try:
+            range_data = extract_range(compressed_filename, offset, length)
+            with open(range_filename, 'wb') as outfile:
+                outfile.write(range_data)
+            print(f"Range extraction complete. Wrote {len(range_data)} bytes to {range_filename}")
+        except DECOMPRESSION_ERRORS as e:
+            print(f"Range extraction failed: {e}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
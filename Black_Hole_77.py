@@ -1,7 +1,12 @@
 import os
 import random
 import struct
+import zlib
 import paq
+from bh_search import ChunkReverser
+
+SURROGATE_ROUND_SIZE = 16  # Candidates ranked by the surrogate per round
+SURROGATE_TOP_K = 4        # Best-ranked candidates per round promoted to paq.compress
 
 def reverse_chunks_at_positions(input_data, chunk_size, positions):
     """Reverses specified chunks of byte data."""
@@ -46,28 +51,75 @@ def decompress_and_restore_paq(compressed_filename):
     except Exception as e:
         print(f"Error during decompression: {e}")
 
-def find_best_iteration(input_filename, max_iterations):
-    """Finds the best compression within a single attempt (out of 7200 iterations)."""
+def surrogate_size(data):
+    """Cheap estimate of the compressed size (zlib level 1) used to rank candidates."""
+    return len(zlib.compress(data, 1))
+
+def rank_agreement(surrogate_sizes, paq_sizes):
+    """Counts the candidate pairs that the surrogate and paq order the same way."""
+    agreed = total = 0
+    for i in range(len(paq_sizes)):
+        for j in range(i + 1, len(paq_sizes)):
+            if paq_sizes[i] != paq_sizes[j]:
+                total += 1
+                if (surrogate_sizes[i] < surrogate_sizes[j]) == (paq_sizes[i] < paq_sizes[j]):
+                    agreed += 1
+    return agreed, total
+
+def report_surrogate_agreement(top1_agreed, rounds, pairs_agreed, pairs_total, top_k):
+    """Prints how well the surrogate ranking matched paq over the promoted candidates."""
+    pair_rate = pairs_agreed / pairs_total if pairs_total else 1.0
+    print(f"Surrogate ranking (top_k={top_k}/{SURROGATE_ROUND_SIZE}): best pick agreed with paq in "
+          f"{top1_agreed}/{rounds} rounds, pairwise order agreed {pairs_agreed}/{pairs_total} ({pair_rate:.1%})")
+
+def find_best_iteration(input_filename, max_iterations, top_k=SURROGATE_TOP_K):
+    """Finds the best compression within a single attempt (out of 7200 iterations).
+
+    Candidates are ranked in rounds by surrogate_size and only the top_k of each
+    round are compressed with paq.
+    """
+    if top_k < 1:
+        raise ValueError("top_k must be at least 1")
     with open(input_filename, 'rb') as infile:
         file_data = infile.read()
         file_size = len(file_data)
+    reverser = ChunkReverser(file_data, pad=False)
 
     best_compression_ratio = float('inf')
     best_compressed_data = None
-
-    for _ in range(max_iterations):
-        chunk_size = random.randint(1, min(256, file_size))
-        num_positions = random.randint(0, min(file_size // chunk_size, 64))
-        positions = sorted(random.sample(range(file_size // chunk_size), num_positions)) if num_positions > 0 else []
-
-        reversed_data = reverse_chunks_at_positions(file_data, chunk_size, positions)
-        compressed_data = compress_with_paq(reversed_data, chunk_size, positions, file_size, 0)
-        compression_ratio = len(compressed_data) / file_size
-
-        if compression_ratio < best_compression_ratio:
-            best_compression_ratio = compression_ratio
-            best_compressed_data = compressed_data
-
+    rounds = top1_agreed = pairs_agreed = pairs_total = 0
+
+    for round_start in range(0, max_iterations, SURROGATE_ROUND_SIZE):
+        candidates = []
+        for _ in range(min(SURROGATE_ROUND_SIZE, max_iterations - round_start)):
+            chunk_size = random.randint(1, min(256, file_size))
+            num_positions = random.randint(0, min(file_size // chunk_size, 64))
+            positions = sorted(random.sample(range(file_size // chunk_size), num_positions)) if num_positions > 0 else []
+
+            reversed_data = reverser.apply(chunk_size, positions)
+            candidates.append((surrogate_size(reversed_data), chunk_size, positions))
+        candidates.sort(key=lambda candidate: candidate[0])
+
+        surrogate_sizes = []
+        paq_sizes = []
+        for estimate, chunk_size, positions in candidates[:top_k]:
+            reversed_data = reverser.apply(chunk_size, positions)
+            compressed_data = compress_with_paq(reversed_data, chunk_size, positions, file_size, 0)
+            compression_ratio = len(compressed_data) / file_size
+            surrogate_sizes.append(estimate)
+            paq_sizes.append(len(compressed_data))
+
+            if compression_ratio < best_compression_ratio:
+                best_compression_ratio = compression_ratio
+                best_compressed_data = compressed_data
+
+        rounds += 1
+        top1_agreed += paq_sizes.index(min(paq_sizes)) == 0
+        agreed, total = rank_agreement(surrogate_sizes, paq_sizes)
+        pairs_agreed += agreed
+        pairs_total += total
+
+    report_surrogate_agreement(top1_agreed, rounds, pairs_agreed, pairs_total, top_k)
     return best_compressed_data, best_compression_ratio
 
 def run_compression(input_filename):
@@ -1,8 +1,12 @@
 import os
 import random
 import struct
+import zlib
 import paq
 
+SURROGATE_ROUND_SIZE = 16  # Candidates ranked by the surrogate per round
+SURROGATE_TOP_K = 4        # Best-ranked candidates per round promoted to paq.compress
+
 def reverse_chunks_at_positions(input_data, chunk_size, positions):
     chunked_data = [input_data[i:i + chunk_size] for i in range(0, len(input_data), chunk_size)]
     for pos in positions:
@@ -40,29 +44,69 @@ def decompress_with_paq(compressed_data):
 
     return original_data[:original_size]
 
-def find_best_iteration(input_filename, max_iterations):
+def surrogate_size(data):
+    return len(zlib.compress(data, 1))
+
+def rank_agreement(surrogate_sizes, paq_sizes):
+    agreed = total = 0
+    for i in range(len(paq_sizes)):
+        for j in range(i + 1, len(paq_sizes)):
+            if paq_sizes[i] != paq_sizes[j]:
+                total += 1
+                if (surrogate_sizes[i] < surrogate_sizes[j]) == (paq_sizes[i] < paq_sizes[j]):
+                    agreed += 1
+    return agreed, total
+
+def report_surrogate_agreement(top1_agreed, rounds, pairs_agreed, pairs_total, top_k):
+    pair_rate = pairs_agreed / pairs_total if pairs_total else 1.0
+    print(f"Surrogate ranking (top_k={top_k}/{SURROGATE_ROUND_SIZE}): best pick agreed with paq in "
+          f"{top1_agreed}/{rounds} rounds, pairwise order agreed {pairs_agreed}/{pairs_total} ({pair_rate:.1%})")
+
+def find_best_iteration(input_filename, max_iterations, top_k=SURROGATE_TOP_K):
+    if top_k < 1:
+        raise ValueError("top_k must be at least 1")
     with open(input_filename, 'rb') as infile:
         file_data = infile.read()
         file_size = len(file_data)
 
     best_compression_ratio = float('inf')
     best_compressed_data = None
-
-    for _ in range(max_iterations):
-        chunk_size = random.randint(1, min(256, file_size))
-        num_positions = random.randint(0, min(file_size // chunk_size, 64))
-        positions = sorted(random.sample(range(file_size // chunk_size), num_positions)) if num_positions > 0 else []
-
-        modified_data = reverse_chunks_at_positions(file_data, chunk_size, positions)
-        modified_data = flip_2bit_pairs(modified_data)
-
-        compressed_data = compress_with_paq(modified_data, chunk_size, positions, file_size)
-        compression_ratio = len(compressed_data) / file_size
-
-        if compression_ratio < best_compression_ratio:
-            best_compression_ratio = compression_ratio
-            best_compressed_data = compressed_data
-
+    rounds = top1_agreed = pairs_agreed = pairs_total = 0
+
+    for round_start in range(0, max_iterations, SURROGATE_ROUND_SIZE):
+        candidates = []
+        for _ in range(min(SURROGATE_ROUND_SIZE, max_iterations - round_start)):
+            chunk_size = random.randint(1, min(256, file_size))
+            num_positions = random.randint(0, min(file_size // chunk_size, 64))
+            positions = sorted(random.sample(range(file_size // chunk_size), num_positions)) if num_positions > 0 else []
+
+            modified_data = reverse_chunks_at_positions(file_data, chunk_size, positions)
+            modified_data = flip_2bit_pairs(modified_data)
+            candidates.append((surrogate_size(modified_data), chunk_size, positions))
+        candidates.sort(key=lambda candidate: candidate[0])
+
+        surrogate_sizes = []
+        paq_sizes = []
+        for estimate, chunk_size, positions in candidates[:top_k]:
+            modified_data = reverse_chunks_at_positions(file_data, chunk_size, positions)
+            modified_data = flip_2bit_pairs(modified_data)
+
+            compressed_data = compress_with_paq(modified_data, chunk_size, positions, file_size)
+            compression_ratio = len(compressed_data) / file_size
+            surrogate_sizes.append(estimate)
+            paq_sizes.append(len(compressed_data))
+
+            if compression_ratio < best_compression_ratio:
+                best_compression_ratio = compression_ratio
+                best_compressed_data = compressed_data
+
+        rounds += 1
+        top1_agreed += paq_sizes.index(min(paq_sizes)) == 0
+        agreed, total = rank_agreement(surrogate_sizes, paq_sizes)
+        pairs_agreed += agreed
+        pairs_total += total
+
+    report_surrogate_agreement(top1_agreed, rounds, pairs_agreed, pairs_total, top_k)
     return best_compressed_data, best_compression_ratio
 
 def run_compression(input_filename):
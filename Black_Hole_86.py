@@ -1,11 +1,15 @@
 import os
 import random
 import struct
+import zlib
 import paq
+from bh_search import ChunkReverser
 
 # Constants for clarity
 METADATA_HEADER_SIZE = 9  # Size of the metadata header in bytes
 MAX_POSITIONS = 64       # Maximum number of chunk positions to reverse
+SURROGATE_ROUND_SIZE = 16  # Candidates ranked by the surrogate per round
+SURROGATE_TOP_K = 4        # Best-ranked candidates per round promoted to paq.compress
 
 def reverse_chunks(data, chunk_size, positions):
     """Reverses specified chunks of byte data."""
@@ -41,32 +45,75 @@ def decompress_data(compressed_data):
         raise Exception(f"Error during decompression: {e}") from None
 
 
-def find_best_iteration(input_data, max_iterations):
-    """Finds the best compression within a specified number of iterations using a heuristic."""
+def surrogate_size(data):
+    """Cheap estimate of the compressed size (zlib level 1) used to rank candidates."""
+    return len(zlib.compress(data, 1))
+
+def rank_agreement(surrogate_sizes, paq_sizes):
+    """Counts the candidate pairs that the surrogate and paq order the same way."""
+    agreed = total = 0
+    for i in range(len(paq_sizes)):
+        for j in range(i + 1, len(paq_sizes)):
+            if paq_sizes[i] != paq_sizes[j]:
+                total += 1
+                if (surrogate_sizes[i] < surrogate_sizes[j]) == (paq_sizes[i] < paq_sizes[j]):
+                    agreed += 1
+    return agreed, total
+
+def report_surrogate_agreement(top1_agreed, rounds, pairs_agreed, pairs_total, top_k):
+    """Prints how well the surrogate ranking matched paq over the promoted candidates."""
+    pair_rate = pairs_agreed / pairs_total if pairs_total else 1.0
+    print(f"Surrogate ranking (top_k={top_k}/{SURROGATE_ROUND_SIZE}): best pick agreed with paq in "
+          f"{top1_agreed}/{rounds} rounds, pairwise order agreed {pairs_agreed}/{pairs_total} ({pair_rate:.1%})")
+
+def find_best_iteration(input_data, max_iterations, top_k=SURROGATE_TOP_K):
+    """Finds the best compression within a specified number of iterations using a heuristic.
+
+    Candidates are ranked in rounds by surrogate_size and only the top_k of each
+    round are compressed with paq.
+    """
+    if top_k < 1:
+        raise ValueError("top_k must be at least 1")
     best_compression_ratio = float('inf')
     best_compressed_data = None
     best_chunk_size = 0
+    reverser = ChunkReverser(input_data, pad=False)
+    rounds = top1_agreed = pairs_agreed = pairs_total = 0
 
-    for _ in range(max_iterations):
+    for round_start in range(0, max_iterations, SURROGATE_ROUND_SIZE):
         # Adaptive chunk size: Start with a medium size, adjust based on previous results
         chunk_size = best_chunk_size or min(128, len(input_data) // 2)  # Default to half the data length
 
-        num_positions = random.randint(0, min(len(input_data) // chunk_size, MAX_POSITIONS))
-        positions = sorted(random.sample(range(len(input_data) // chunk_size), num_positions)) if num_positions > 0 else []
-
-        reversed_data = reverse_chunks(input_data, chunk_size, positions)
-        compressed_data = compress_data(reversed_data, chunk_size, positions, len(input_data))
-        compression_ratio = len(compressed_data) / len(input_data)
-
-        if compression_ratio < best_compression_ratio:
-            best_compression_ratio = compression_ratio
-            best_compressed_data = compressed_data
-            best_chunk_size = chunk_size  # Update best chunk size
-
-        # Adjust chunk size based on compression ratio (example heuristic)
-        if compression_ratio > 0.8: #If compression is poor, try a different chunk size
-            chunk_size = max(1, chunk_size // 2) #Reduce chunk size
-
+        candidates = []
+        for _ in range(min(SURROGATE_ROUND_SIZE, max_iterations - round_start)):
+            num_positions = random.randint(0, min(len(input_data) // chunk_size, MAX_POSITIONS))
+            positions = sorted(random.sample(range(len(input_data) // chunk_size), num_positions)) if num_positions > 0 else []
+
+            reversed_data = reverser.apply(chunk_size, positions)
+            candidates.append((surrogate_size(reversed_data), positions))
+        candidates.sort(key=lambda candidate: candidate[0])
+
+        surrogate_sizes = []
+        paq_sizes = []
+        for estimate, positions in candidates[:top_k]:
+            reversed_data = reverser.apply(chunk_size, positions)
+            compressed_data = compress_data(reversed_data, chunk_size, positions, len(input_data))
+            compression_ratio = len(compressed_data) / len(input_data)
+            surrogate_sizes.append(estimate)
+            paq_sizes.append(len(compressed_data))
+
+            if compression_ratio < best_compression_ratio:
+                best_compression_ratio = compression_ratio
+                best_compressed_data = compressed_data
+                best_chunk_size = chunk_size  # Update best chunk size
+
+        rounds += 1
+        top1_agreed += paq_sizes.index(min(paq_sizes)) == 0
+        agreed, total = rank_agreement(surrogate_sizes, paq_sizes)
+        pairs_agreed += agreed
+        pairs_total += total
+
+    report_surrogate_agreement(top1_agreed, rounds, pairs_agreed, pairs_total, top_k)
     return best_compressed_data, best_compression_ratio
 
 
@@ -1,10 +1,14 @@
 import os
 import random
 import struct
+import zlib
 import paq
+from bh_search import CompressionCache
 
 # Constants
 MAX_POSITIONS = 64  # Maximum number of chunk positions to reverse
+SURROGATE_ROUND_SIZE = 16  # Candidates ranked by the surrogate per round
+SURROGATE_TOP_K = 4        # Best-ranked candidates per round promoted to paq.compress
 
 def reverse_chunks(data, chunk_size, positions):
     """Reverses specified chunks of byte data."""
@@ -43,29 +47,91 @@ def decompress_data(compressed_data):
     except (struct.error, paq.error) as e:
         raise Exception(f"Error during decompression: {e}") from None
 
-def find_best_iteration(input_data, max_iterations):
-    """Finds the best compression within a specified number of iterations using a heuristic."""
+def surrogate_size(data):
+    """Cheap estimate of the compressed size (zlib level 1) used to rank candidates."""
+    return len(zlib.compress(data, 1))
+
+def rank_agreement(surrogate_sizes, paq_sizes):
+    """Counts the candidate pairs that the surrogate and paq order the same way."""
+    agreed = total = 0
+    for i in range(len(paq_sizes)):
+        for j in range(i + 1, len(paq_sizes)):
+            if paq_sizes[i] != paq_sizes[j]:
+                total += 1
+                if (surrogate_sizes[i] < surrogate_sizes[j]) == (paq_sizes[i] < paq_sizes[j]):
+                    agreed += 1
+    return agreed, total
+
+def report_surrogate_agreement(top1_agreed, rounds, pairs_agreed, pairs_total, top_k):
+    """Prints how well the surrogate ranking matched paq over the promoted candidates."""
+    pair_rate = pairs_agreed / pairs_total if pairs_total else 1.0
+    print(f"Surrogate ranking (top_k={top_k}/{SURROGATE_ROUND_SIZE}): best pick agreed with paq in "
+          f"{top1_agreed}/{rounds} rounds, pairwise order agreed {pairs_agreed}/{pairs_total} ({pair_rate:.1%})")
+
+def find_best_iteration(input_data, max_iterations, top_k=SURROGATE_TOP_K):
+    """Finds the best compression within a specified number of iterations using a heuristic.
+
+    Candidates are ranked in rounds by surrogate_size and only the top_k of each
+    round are compressed with paq.
+    """
+    if top_k < 1:
+        raise ValueError("top_k must be at least 1")
     best_compression_ratio = float('inf')
     best_compressed_data = None
-
-    for _ in range(max_iterations):
-        chunk_size = random.randint(2**7, 2**17 - 1)  # Random chunk size in the range 2⁷ to 2¹⁷
-        x = random.randint(7, 17)  # Randomly choose x between 7 and 17
-        calculus_value = random.randint(1, (2**x) - 1)  # Random value from 1 to (2ˣ - 1)
-        
-        num_positions = random.randint(0, min(len(input_data) // chunk_size, MAX_POSITIONS))
-        positions = sorted(random.sample(range(len(input_data) // chunk_size), num_positions)) if num_positions > 0 else []
-
-        transformed_data = apply_calculus(input_data, calculus_value)
-        reversed_data = reverse_chunks(transformed_data, chunk_size, positions)
-        compressed_data = compress_data(reversed_data, chunk_size, positions, len(input_data), calculus_value)
-
-        compression_ratio = len(compressed_data) / len(input_data)
-
-        if compression_ratio < best_compression_ratio:
-            best_compression_ratio = compression_ratio
-            best_compressed_data = compressed_data
-
+    rounds = top1_agreed = pairs_agreed = pairs_total = 0
+    cache = CompressionCache()
+
+    for round_start in range(0, max_iterations, SURROGATE_ROUND_SIZE):
+        candidates = []
+        round_keys = set()
+        for _ in range(min(SURROGATE_ROUND_SIZE, max_iterations - round_start)):
+            chunk_size = random.randint(2**7, 2**17 - 1)  # Random chunk size in the range 2⁷ to 2¹⁷
+            x = random.randint(7, 17)  # Randomly choose x between 7 and 17
+            calculus_value = random.randint(1, (2**x) - 1)  # Random value from 1 to (2ˣ - 1)
+
+            num_positions = random.randint(0, min(len(input_data) // chunk_size, MAX_POSITIONS))
+            positions = sorted(random.sample(range(len(input_data) // chunk_size), num_positions)) if num_positions > 0 else []
+            key = CompressionCache.key(chunk_size, positions, calculus_value)
+            if key in round_keys:
+                cache.hits += 1
+                continue
+            if cache.get(key) is not None:
+                # Already evaluated in this search, so it cannot beat the best.
+                continue
+            round_keys.add(key)
+
+            transformed_data = apply_calculus(input_data, calculus_value)
+            reversed_data = reverse_chunks(transformed_data, chunk_size, positions)
+            candidates.append((surrogate_size(reversed_data), key, chunk_size, positions, calculus_value))
+        if not candidates:
+            continue
+        candidates.sort(key=lambda candidate: candidate[0])
+
+        surrogate_sizes = []
+        paq_sizes = []
+        for estimate, key, chunk_size, positions, calculus_value in candidates[:top_k]:
+            transformed_data = apply_calculus(input_data, calculus_value)
+            reversed_data = reverse_chunks(transformed_data, chunk_size, positions)
+            compressed_data = compress_data(reversed_data, chunk_size, positions, len(input_data), calculus_value)
+
+            cache.put(key, len(compressed_data))
+
+            compression_ratio = len(compressed_data) / len(input_data)
+            surrogate_sizes.append(estimate)
+            paq_sizes.append(len(compressed_data))
+
+            if compression_ratio < best_compression_ratio:
+                best_compression_ratio = compression_ratio
+                best_compressed_data = compressed_data
+
+        rounds += 1
+        top1_agreed += paq_sizes.index(min(paq_sizes)) == 0
+        agreed, total = rank_agreement(surrogate_sizes, paq_sizes)
+        pairs_agreed += agreed
+        pairs_total += total
+
+    report_surrogate_agreement(top1_agreed, rounds, pairs_agreed, pairs_total, top_k)
+    cache.report()
     return best_compressed_data, best_compression_ratio
 
 def process_large_file(input_filename, output_filename, mode, attempts=1, iterations=100):
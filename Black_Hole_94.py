@@ -1,10 +1,14 @@
 import os
 import random
 import struct
+import zlib
 import paq
+from bh_search import CompressionCache
 
 # Constants
 MAX_POSITIONS = 64
+SURROGATE_ROUND_SIZE = 16  # Candidates ranked by the surrogate per round
+SURROGATE_TOP_K = 4        # Best-ranked candidates per round promoted to paq.compress
 
 def reverse_chunks(data, chunk_size, positions):
     chunked_data = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
@@ -46,31 +50,87 @@ def decompress_data(compressed_data):
     except (struct.error, zlib.error, ValueError) as e:
         raise Exception(f"Error during decompression: {e}")
 
-def find_best_iteration(input_data, max_iterations, chunk_size):
+def surrogate_size(data):
+    return len(zlib.compress(data, 1))
+
+def rank_agreement(surrogate_sizes, paq_sizes):
+    agreed = total = 0
+    for i in range(len(paq_sizes)):
+        for j in range(i + 1, len(paq_sizes)):
+            if paq_sizes[i] != paq_sizes[j]:
+                total += 1
+                if (surrogate_sizes[i] < surrogate_sizes[j]) == (paq_sizes[i] < paq_sizes[j]):
+                    agreed += 1
+    return agreed, total
+
+def report_surrogate_agreement(top1_agreed, rounds, pairs_agreed, pairs_total, top_k):
+    pair_rate = pairs_agreed / pairs_total if pairs_total else 1.0
+    print(f"Surrogate ranking (top_k={top_k}/{SURROGATE_ROUND_SIZE}): best pick agreed with paq in "
+          f"{top1_agreed}/{rounds} rounds, pairwise order agreed {pairs_agreed}/{pairs_total} ({pair_rate:.1%})")
+
+def find_best_iteration(input_data, max_iterations, chunk_size, top_k=SURROGATE_TOP_K):
+    if top_k < 1:
+        raise ValueError("top_k must be at least 1")
     best_result = compress_data(input_data, chunk_size, [], len(input_data), 0)
     best_size = len(best_result)
     best_ratio = best_size / len(input_data)
     best_data = best_result
-
-    for i in range(1, max_iterations + 1):
-        x = random.randint(7, 17)
-        calculus_value = random.randint(1, (2 ** x) - 1)
-        num_pos = random.randint(0, min(len(input_data) // chunk_size, MAX_POSITIONS))
-        positions = sorted(random.sample(range(len(input_data) // chunk_size), num_pos)) if num_pos > 0 else []
-
-        transformed = apply_calculus(input_data, calculus_value)
-        reversed_data = reverse_chunks(transformed, chunk_size, positions)
-        compressed = compress_data(reversed_data, chunk_size, positions, len(input_data), calculus_value)
-
-        comp_size = len(compressed)
-        if comp_size < best_size:
-            best_size = comp_size
-            best_data = compressed
-            best_ratio = comp_size / len(input_data)
-            saved = len(input_data) - comp_size
-            print(f"Iteration {i}: Compressed size {comp_size}, Saved {saved} bytes, Ratio: {best_ratio:.5f}")
+    rounds = top1_agreed = pairs_agreed = pairs_total = 0
+    cache = CompressionCache()
+    cache.put(CompressionCache.key(chunk_size, [], 0), best_size)
+
+    for round_start in range(0, max_iterations, SURROGATE_ROUND_SIZE):
+        # Rank a round of candidates with the surrogate, then paq only the top_k.
+        candidates = []
+        round_keys = set()
+        for i in range(round_start + 1, min(round_start + SURROGATE_ROUND_SIZE, max_iterations) + 1):
+            x = random.randint(7, 17)
+            calculus_value = random.randint(1, (2 ** x) - 1)
+            num_pos = random.randint(0, min(len(input_data) // chunk_size, MAX_POSITIONS))
+            positions = sorted(random.sample(range(len(input_data) // chunk_size), num_pos)) if num_pos > 0 else []
+            key = CompressionCache.key(chunk_size, positions, calculus_value)
+            if key in round_keys:
+                cache.hits += 1
+                continue
+            if cache.get(key) is not None:
+                # Already evaluated in this search, so it cannot beat the best.
+                continue
+            round_keys.add(key)
+
+            transformed = apply_calculus(input_data, calculus_value)
+            reversed_data = reverse_chunks(transformed, chunk_size, positions)
+            candidates.append((surrogate_size(reversed_data), key, i, positions, calculus_value))
+        if not candidates:
+            continue
+        candidates.sort(key=lambda candidate: candidate[0])
+
+        surrogate_sizes = []
+        paq_sizes = []
+        for estimate, key, i, positions, calculus_value in candidates[:top_k]:
+            transformed = apply_calculus(input_data, calculus_value)
+            reversed_data = reverse_chunks(transformed, chunk_size, positions)
+            compressed = compress_data(reversed_data, chunk_size, positions, len(input_data), calculus_value)
+
+            comp_size = len(compressed)
+            cache.put(key, comp_size)
+            surrogate_sizes.append(estimate)
+            paq_sizes.append(comp_size)
+            if comp_size < best_size:
+                best_size = comp_size
+                best_data = compressed
+                best_ratio = comp_size / len(input_data)
+                saved = len(input_data) - comp_size
+                print(f"Iteration {i}: Compressed size {comp_size}, Saved {saved} bytes, Ratio: {best_ratio:.5f}")
+
+        rounds += 1
+        top1_agreed += paq_sizes.index(min(paq_sizes)) == 0
+        agreed, total = rank_agreement(surrogate_sizes, paq_sizes)
+        pairs_agreed += agreed
+        pairs_total += total
 
     print(f"\nFinal best saved {len(input_data) - best_size} bytes, Ratio: {best_ratio:.5f}")
+    report_surrogate_agreement(top1_agreed, rounds, pairs_agreed, pairs_total, top_k)
+    cache.report()
     return best_data, best_ratio
 
 def process_large_file(input_filename, output_filename, mode, attempts=1, iterations=100, fixed_chunk_size=None):
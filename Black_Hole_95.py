@@ -2,6 +2,8 @@ import os
 import random
 import time
 import math
+import zlib
+from collections import Counter
 import paq
 from tqdm import tqdm
 from qiskit import QuantumCircuit
@@ -150,8 +152,8 @@ def compress_data(data):
 def decompress_data(data):
     return paq.decompress(data)
 
-def quantum_dict_compress(data, attempts=4, iterations=3):
-    qc = QuantumDictionaryCompressor()
+def quantum_dict_compress(data, attempts=4, iterations=3, qc=None):
+    qc = qc or QuantumDictionaryCompressor()
     best = compress_data(data)
     best_size = len(best)
     for _ in tqdm(range(attempts), desc="Quantum Dictionary Compression"):
@@ -175,6 +177,60 @@ def compress_with_iterations(data, attempts=4, iterations=4):
                 best, best_size = compressed, len(compressed)
     return best
 
+# --- Pre-flight Profiler ---
+PROFILE_SAMPLES = 4              # stratified samples taken across the input
+PROFILE_SAMPLE_SIZE = 64 * 1024  # bytes per sample
+RANDOM_ENTROPY = 7.95            # bits/byte above which a sample looks incompressible
+DEFAULT_ATTEMPTS = 4
+
+def stratified_samples(data, count=PROFILE_SAMPLES, size=PROFILE_SAMPLE_SIZE):
+    if len(data) <= count * size:
+        return [data]
+    stride = (len(data) - size) // (count - 1)
+    return [data[i * stride:i * stride + size] for i in range(count)]
+
+def byte_entropy(data):
+    if not data:
+        return 0.0
+    total = len(data)
+    return -sum(n / total * math.log2(n / total) for n in Counter(data).values())
+
+def repetitiveness(data):
+    # Share of the sample a fast zlib pass removes: 0 for random data, near 1 for repeats.
+    if not data:
+        return 0.0
+    return max(0.0, 1 - len(zlib.compress(data, 1)) / len(data))
+
+def profile_input(data, qc):
+    # One trial of each pipeline on the samples only; a pipeline that cannot
+    # beat plain paq there gets no attempts on the full file.
+    samples = stratified_samples(data)
+    entropy = sum(byte_entropy(sample) for sample in samples) / len(samples)
+    repeats = sum(repetitiveness(sample) for sample in samples) / len(samples)
+    plan = {"entropy": entropy, "repetitiveness": repeats, "quantum_attempts": 0, "hybrid_attempts": 0}
+    if entropy >= RANDOM_ENTROPY and repeats < 0.01:
+        return plan
+
+    baseline = quantum = hybrid = 0
+    for sample in samples:
+        baseline += len(compress_data(sample))
+        temp = sample
+        for _ in range(3):
+            temp = dictionary_specific_transforms(temp, qc)
+        quantum += len(compress_data(temp))
+        temp = sample
+        best = None
+        for _ in range(4):
+            temp = apply_random_transformations(temp)
+            size = len(compress_data(temp))
+            best = size if best is None else min(best, size)
+        hybrid += best
+    if quantum < baseline:
+        plan["quantum_attempts"] = DEFAULT_ATTEMPTS
+    if hybrid < baseline:
+        plan["hybrid_attempts"] = DEFAULT_ATTEMPTS
+    return plan
+
 # --- CLI ---
 def main():
     print("Quantum Smart Compressor")
@@ -188,11 +244,22 @@ def main():
             with open(in_file, 'rb') as f:
                 data = f.read()
 
+            print("Profiling samples...")
+            qc = QuantumDictionaryCompressor()
+            plan = profile_input(data, qc)
+            print(f"Entropy {plan['entropy']:.2f} bits/byte, repetitiveness {plan['repetitiveness']:.1%}: "
+                  f"{plan['quantum_attempts']} quantum, {plan['hybrid_attempts']} hybrid attempts")
+
             print("Running hybrid quantum + smart compression...")
-            result1 = quantum_dict_compress(data)
-            result2 = compress_with_iterations(data)
+            results = []
+            if plan["quantum_attempts"]:
+                results.append(quantum_dict_compress(data, attempts=plan["quantum_attempts"], qc=qc))
+            if plan["hybrid_attempts"]:
+                results.append(compress_with_iterations(data, attempts=plan["hybrid_attempts"]))
+            if not results:
+                results.append(compress_data(data))
 
-            final_result = result1 if len(result1) < len(result2) else result2
+            final_result = min(results, key=len)
 
             with open(out_file, 'wb') as f:
                 f.write(final_result)
@@ -0,0 +1,84 @@
+import hashlib
+import struct
+from collections import OrderedDict
+
+CACHE_MAX_ENTRIES = 65536  # Evaluated configurations remembered per search
+
+class CompressionCache:
+    """Bounded LRU of compressed sizes for already-evaluated candidate parameters."""
+
+    def __init__(self, max_entries=CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(chunk_size, positions, *params):
+        """Canonical digest of a candidate; positions are order-independent.
+
+        params are any further integer settings of the candidate, such as the
+        calculus value of Black_Hole_89 and Black_Hole_94.
+        """
+        packed = struct.pack(f">I{len(params)}I{len(positions)}I", chunk_size, *params, *sorted(positions))
+        return hashlib.blake2b(packed, digest_size=16).digest()
+
+    def get(self, key):
+        """Returns the cached compressed size, or None on a miss."""
+        size = self.entries.get(key)
+        if size is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return size
+
+    def put(self, key, size):
+        self.entries[key] = size
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def report(self):
+        lookups = self.hits + self.misses
+        hit_rate = self.hits / lookups if lookups else 0.0
+        print(f"Cache: {self.hits} hits, {self.misses} misses ({hit_rate:.1%} of candidates skipped compression)")
+
+class ChunkReverser:
+    """Working copy of the input that candidates are reversed in place.
+
+    apply() first undoes the previous candidate, then reverses only the chunks
+    it selects, so a candidate costs the bytes it touches instead of a rebuild
+    of the whole file. With pad, the last chunk is zero-filled to chunk_size
+    as reverse_chunks_at_positions() does in Black_Hole_71, 73 and 74. The
+    returned buffer stays valid only until the next apply() or undo().
+    """
+
+    def __init__(self, data, pad=True):
+        self.size = len(data)
+        self.buffer = bytearray(data)
+        self.pad = pad
+        self.chunk_size = 1
+        self.touched = []
+
+    def _reverse_touched(self):
+        buffer, chunk_size = self.buffer, self.chunk_size
+        for pos in self.touched:
+            start = pos * chunk_size
+            buffer[start:start + chunk_size] = buffer[start:start + chunk_size][::-1]
+
+    def undo(self):
+        """Returns the buffer to the original input."""
+        self._reverse_touched()
+        self.touched = []
+        del self.buffer[self.size:]
+
+    def apply(self, chunk_size, positions):
+        """Reverses the chunks at positions and returns the buffer."""
+        self.undo()
+        if self.pad:
+            self.buffer.extend(bytes(-self.size % chunk_size))
+        num_chunks = -(-len(self.buffer) // chunk_size)
+        self.chunk_size = chunk_size
+        self.touched = [pos for pos in positions if 0 <= pos < num_chunks]
+        self._reverse_touched()
+        return self.buffer
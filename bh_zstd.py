@@ -0,0 +1,122 @@
+import os
+import hashlib
+import random
+import struct
+import zstandard as zstd
+
+# Tuned zstd backend shared by the Black_Hole_1.x scripts for the final write and extraction
+ZSTD_LEVEL = 3
+ZSTD_THREADS = -1  # -1 uses one worker thread per CPU, 0 compresses on the calling thread
+ZSTD_LONG_DISTANCE_MATCHING = True
+ZSTD_WINDOW_LOG = 27  # 128 MiB match window; extraction accepts windows up to this size
+
+# The search makes many small calls, where worker threads and LDM only add setup cost
+ZSTD_SEARCH_SETTINGS = (ZSTD_LEVEL, 0, False, None)
+
+# zstd dictionary trained on the bundled word list (plus optional extra corpora) for small text inputs
+DICTIONARY_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Dictionary.txt")
+DICTIONARY_CORPORA = []  # extra sample files to train on, e.g. ["notes.txt", "mail.txt"]
+DICTIONARY_SIZE = 110 * 1024
+DICTIONARY_SAMPLE_WORDS = 64  # words per training sample
+DICTIONARY_SAMPLE_SIZE = 4096  # bytes per training sample cut from the extra corpora
+DICTIONARY_MAX_INPUT = 1024 * 1024  # larger inputs build their own history and gain nothing
+
+# Build one compressor and one decompressor context for the given settings
+def make_zstd_contexts(level=ZSTD_LEVEL, threads=ZSTD_THREADS, long_distance_matching=ZSTD_LONG_DISTANCE_MATCHING, window_log=ZSTD_WINDOW_LOG, dict_data=None):
+    tuning = {"threads": threads, "enable_ldm": long_distance_matching, "write_dict_id": dict_data is not None}
+    if window_log is not None:
+        tuning["window_log"] = window_log
+    params = zstd.ZstdCompressionParameters.from_level(level, **tuning)
+    cctx = zstd.ZstdCompressor(compression_params=params, dict_data=dict_data)
+    dctx = zstd.ZstdDecompressor(dict_data=dict_data, max_window_size=2 ** max(window_log or 0, ZSTD_WINDOW_LOG))
+    return cctx, dctx
+
+cctx, dctx = make_zstd_contexts()
+search_cctx = make_zstd_contexts(*ZSTD_SEARCH_SETTINGS)[0]
+
+# Training samples: the word list shuffled with a fixed seed into short runs, plus slices of the corpora
+def dictionary_samples(contents):
+    words = contents[0].split()
+    random.Random(0).shuffle(words)
+    samples = [b" ".join(words[i:i + DICTIONARY_SAMPLE_WORDS]) for i in range(0, len(words), DICTIONARY_SAMPLE_WORDS)]
+    for corpus in contents[1:]:
+        samples += [corpus[i:i + DICTIONARY_SAMPLE_SIZE] for i in range(0, len(corpus), DICTIONARY_SAMPLE_SIZE)]
+    return samples
+
+_dictionary = None
+
+# Load the dictionary from its on-disk cache, training it the first time; the cache name is the hash of everything it was built from
+def load_dictionary():
+    global _dictionary
+    if _dictionary is None:
+        contents = []
+        for filename in [DICTIONARY_SOURCE] + DICTIONARY_CORPORA:
+            with open(filename, 'rb') as infile:
+                contents.append(infile.read())
+        digest = hashlib.blake2b(struct.pack(">II", DICTIONARY_SIZE, DICTIONARY_SAMPLE_WORDS), digest_size=8)
+        for data in contents:
+            digest.update(struct.pack(">Q", len(data)))
+            digest.update(data)
+        cache_filename = f"{DICTIONARY_SOURCE}.{digest.hexdigest()}.zdict"
+        if os.path.exists(cache_filename):
+            with open(cache_filename, 'rb') as infile:
+                _dictionary = zstd.ZstdCompressionDict(infile.read())
+        else:
+            print("📖 Training zstd dictionary from Dictionary.txt...")
+            _dictionary = zstd.train_dictionary(DICTIONARY_SIZE, dictionary_samples(contents), k=1024, d=8)
+            with open(cache_filename + ".tmp", 'wb') as outfile:
+                outfile.write(_dictionary.as_bytes())
+            os.replace(cache_filename + ".tmp", cache_filename)
+    return _dictionary
+
+# Small inputs that are mostly printable ASCII are worth trying with the dictionary
+def looks_like_text(data):
+    if not data or len(data) > DICTIONARY_MAX_INPUT or not os.path.exists(DICTIONARY_SOURCE):
+        return False
+    sample = data[:4096]
+    printable = sum(1 for b in sample if 32 <= b < 127 or b in (9, 10, 13))
+    return printable >= 0.95 * len(sample)
+
+# Small text files are written with the dictionary when it beats plain zstd; the frame header records its id
+def final_compressor(prefix, filename):
+    if os.path.getsize(filename) > DICTIONARY_MAX_INPUT:
+        return cctx
+    with open(filename, 'rb') as infile:
+        data = infile.read()
+    if not looks_like_text(data):
+        return cctx
+    dictionary = load_dictionary()
+    compressor = make_zstd_contexts(dict_data=dictionary)[0]
+    if len(compressor.compress(prefix + data)) < len(cctx.compress(prefix + data)):
+        print(f"📖 Using zstd dictionary {dictionary.dict_id()}")
+        return compressor
+    return cctx
+
+# Decompressor for a frame, loading the dictionary only when the frame header names one
+def decompressor_for(compressed_data):
+    dict_id = zstd.get_frame_parameters(compressed_data).dict_id
+    if not dict_id:
+        return dctx
+    dictionary = load_dictionary()
+    if dictionary.dict_id() != dict_id:
+        raise ValueError(f"File needs zstd dictionary {dict_id}, but Dictionary.txt gives {dictionary.dict_id()}.")
+    return make_zstd_contexts(dict_data=dictionary)[1]
+
+# Reader that returns the metadata bytes before the data, so both go through one copy_stream
+class PrefixedReader:
+    def __init__(self, prefix, infile):
+        self.prefix = prefix
+        self.infile = infile
+
+    def read(self, size=-1):
+        if not self.prefix:
+            return self.infile.read(size)
+        if size < 0:
+            data, self.prefix = self.prefix + self.infile.read(), b""
+            return data
+        data, self.prefix = self.prefix[:size], self.prefix[size:]
+        return data
+
+# Compress metadata followed by the contents of infile into outfile, streaming
+def copy_compressed(metadata, infile, data_size, outfile, compressor=None):
+    (compressor or cctx).copy_stream(PrefixedReader(metadata, infile), outfile, size=len(metadata) + data_size)